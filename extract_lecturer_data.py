@@ -1,10 +1,11 @@
 import pandas as pd
-import json
 import os
 
-def generate_lecturer_db_content(excel_file_path, sheet_name=0):
+from srtemodules.lecturer_db import REGISTRY_FILE, write_registry
+
+def extract_lecturer_records(excel_file_path, sheet_name=0):
     """
-    Reads an Excel file, extracts lecturer data, and formats it as a Python list of dictionaries.
+    Reads an Excel file and extracts lecturer data as a list of dictionaries.
 
     Args:
         excel_file_path (str): The full path to your Excel file (e.g., 'C:/path/to/Lecturer database.xlsx').
@@ -12,7 +13,7 @@ def generate_lecturer_db_content(excel_file_path, sheet_name=0):
                                   Defaults to 0 (first sheet).
 
     Returns:
-        str: A string containing the Python list of dictionaries, ready to be pasted.
+        list: One dict per lecturer with 'Official Name', 'Department', 'School' and 'Aliases'.
     """
     try:
         # Read the Excel file
@@ -51,21 +52,7 @@ def generate_lecturer_db_content(excel_file_path, sheet_name=0):
 
             lecturer_data.append(entry)
 
-        # Format the list of dictionaries as a Python string
-        # Use json.dumps with indent for readability
-        formatted_data = json.dumps(lecturer_data, indent=4, ensure_ascii=False)
-
-        # Construct the final Python script content
-        script_content = f"""# C:\\Users\\OIE 21\\srte\\srtemodules\\lecturer_db.py
-
-# This list holds your lecturer data extracted from your Excel file.
-# You can update this list directly as your lecturer data changes.
-
-lecturer_data = {formatted_data}
-
-# You can add more data structures here if needed.
-"""
-        return script_content
+        return lecturer_data
 
     except FileNotFoundError:
         print(f"Error: Excel file not found at '{excel_file_path}'. Please check the path.")
@@ -76,7 +63,7 @@ lecturer_data = {formatted_data}
 
 if __name__ == "__main__":
     print("--- Lecturer Database Extractor ---")
-    print("This script will help you convert your Excel lecturer database into a Python script.")
+    print("This script converts your Excel lecturer database into the compact lecturer registry used by the app.")
     print("Ensure your Excel file has columns like 'Official Name', 'Department', 'School', and optionally 'Aliases'.")
 
     # Prompt user for file path
@@ -90,15 +77,15 @@ if __name__ == "__main__":
         print("Invalid sheet input. Using default sheet 0.")
         sheet_name = 0
 
-    generated_script = generate_lecturer_db_content(excel_path, sheet_name)
+    lecturer_records = extract_lecturer_records(excel_path, sheet_name)
 
-    if generated_script:
-        print("\n--- GENERATED LECTURER DATA FOR lecturer_db.py ---")
-        print("Copy the content below and paste it into your 'C:\\Users\\OIE 21\\srte\\srtemodules\\lecturer_db.py' file.")
-        print("---------------------------------------------------\n")
-        print(generated_script)
-        print("\n---------------------------------------------------")
-        print("Done! Remember to save lecturer_db.py after pasting.")
+    if lecturer_records:
+        try:
+            write_registry(lecturer_records)
+        except ValueError as e:
+            print(f"\n{e}")
+        else:
+            print(f"\nWrote {len(lecturer_records)} lecturers to {REGISTRY_FILE}.")
+            print("Done! The app will load the new registry on its next start.")
     else:
-        print("\nFailed to generate lecturer data. Please review errors above.")
-
+        print("\nFailed to extract lecturer data. Please review errors above.")
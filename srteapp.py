@@ -1,11 +1,8 @@
-import base64
-import glob
+import io
+import multiprocessing
 import os
 import pathlib
-from os.path import basename
-from zipfile import ZipFile
 
-import pandas as pd
 import streamlit as sl
 from fpdf import FPDF # This will now point to the older fpdf library
 from PIL import Image
@@ -31,9 +28,13 @@ print("-------------------------------------------------")
 # Import the core analysis function (now includes lecturer standardization internally)
 from srtemodules.analyzer import analyze
 # Import the new data standardizer specifically for the "Generate Reports" path
-from srtemodules.data_standardizer import standardize_lecturer_data
-from srtemodules.coursecode import courses
-from srtemodules.lecturers_reporter_ref import generate_lec_report
+from srtemodules.data_standardizer import standardize_lecturer_data, suggest_lecturer_matches
+from srtemodules.alias_store import record_aliases
+from srtemodules.coursecode import load_course_registry
+from srtemodules import data_loader
+from srtemodules.data_loader import COMMENT_HEADER, apply_header
+from srtemodules.lecturers_reporter_ref import render_lec_reports, zip_files
+from srtemodules.upload_cache import cached_read
 
 # Removed the import for download_font_if_not_exists as it's no longer in srte_report.py
 # from srtemodules.srte_report import download_font_if_not_exists
@@ -51,58 +52,65 @@ def extract_new_codes(new):
     new["new"] = new["new"].apply(lambda x: x[0])
     new = new["new"].unique()
 
-    new_codes = []
-
-    for code in new:
-        if code in courses:
-            pass
-        else:
-            new_codes.append(code)
+    # Re-read on every check so prefixes added to the registry file are picked up
+    known_codes = load_course_registry().prefixes
+    new_codes = [code for code in new if code not in known_codes]
 
     return new_codes
 
 
-# outputs analysis results for downloads
-def reportdownload(pdf_b64, name):
-    href = f'<a href="data:application/pdf;base64, {pdf_b64}" download="{name}.pdf">Click Here to Download SRTE report for {name}</a>'
-    return href
+# outputs analysis results for downloads; the bytes are served as-is, without base64
+def reportdownload(canvas, pdf_bytes, name):
+    canvas.download_button(
+        f"Click Here to Download SRTE report for {name}",
+        data=pdf_bytes,
+        file_name=f"{name}.pdf",
+        mime="application/pdf",
+        on_click="ignore", # keep the page as is, like the old download links
+        key=f"download_report_{name}",
+    )
 
 
 # outputs analysis results for downloads
-def zipsummaries(zip_b64, name):
-    href = f'<a href="data:application/zip;base64, {zip_b64}" download="{name}">Click Here to Download SRTE summaries</a>'
-
-    return href
+def zipsummaries(canvas, zip_bytes, name):
+    canvas.download_button(
+        "Click Here to Download SRTE summaries",
+        data=zip_bytes,
+        file_name=name,
+        mime="application/zip",
+        on_click="ignore",
+        key="download_summaries",
+    )
 
 
 # outputs analysis results for downloads
-def zipdownload(zip_b64, name):
-    href = f'<a href="data:application/zip;base64, {zip_b64}" download="{name}">Click Here to Download SRTE reports</a>'
-    return href
-
-
+def zipdownload(canvas, zip_bytes, name):
+    canvas.download_button(
+        "Click Here to Download SRTE reports",
+        data=zip_bytes,
+        file_name=name,
+        mime="application/zip",
+        on_click="ignore",
+        key="download_reports",
+    )
+
+
+# Parsed uploads are also cached on disk by content hash, so a workbook opened
+# before (in any session, or before a restart) is not parsed again
 @sl.cache_data
 def readdata(datafile):
-    """Reads the raw SRTE data Excel file."""
-    df = pd.read_excel(datafile)
-    # Assuming the last two columns are not part of the core data
-    df = df[df.columns[0:-2]]
-    return df
+    """Reads the raw SRTE data Excel file, streaming it in read-only mode."""
+    return cached_read(datafile, data_loader.read_raw_data, "raw")
 
 @sl.cache_data
 def read_comment_data(datafile):
     """Reads the comments data Excel file."""
-    df = pd.read_excel(datafile)
-    # Assuming columns 2 to 25 are not comments
-    df = df.drop(df.columns[2:25], axis=1)
-    return df
+    return cached_read(datafile, data_loader.read_comment_data, "comment")
 
 @sl.cache_data
 def read_summary_data(datafile):
     """Reads the summary data Excel file."""
-    df = pd.read_excel(datafile)
-    df = df.dropna(axis=0) # Drop rows with any NaN values
-    return df
+    return cached_read(datafile, data_loader.read_summary_data, "summary")
 
     
 def main():
@@ -127,19 +135,11 @@ def main():
             file = nav_menu.file_uploader("Choose SRTE Raw Data file (Excel)...", type=["xlsx"], key="file")
 
             if file is not None:
-                dataset = readdata(file)
-                # Define expected headers for the raw data
-                header = [
-                    "Course Title", "Lecturer Name", "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7",
-                    "TA8", "TA9", "TA10", "TA11", "TA12", "CM13", "CM14", "CM15", "CM16",
-                    "IF17", "IF18", "IF19", "IF20", "IF21", "PTA22", "PTA23",
-                ]
-                
-                # Check if the number of columns matches the header length before assigning
-                if len(dataset.columns) == len(header):
-                    dataset.columns = header
-                else:
-                    content_canvas.error(f"Error: The uploaded file has {len(dataset.columns)} columns, but {len(header)} columns were expected. Please check your raw data file format.")
+                # The reader checks the number of columns and names them
+                try:
+                    dataset = readdata(file)
+                except ValueError as e:
+                    content_canvas.error(str(e))
                     sl.stop() # Stop execution if column mismatch
 
                 sl.session_state["dataset"] = dataset
@@ -155,32 +155,16 @@ def main():
                     results = analyze(dataset)
                     content_canvas.success("SRTE Analysis and Lecturer Standardization completed successfully!")
 
-                    # Create a zip file for school-wise summaries
-                    zippedObj = ZipFile("srte_summaries.zip", "w")
-
+                    # Build the zip of school-wise summaries in memory
+                    summaries = {}
                     for school_name, school_df in results.items():
-                        # Save each school's analyzed data to an Excel file
-                        excel_filename = f"{school_name}.xlsx"
-                        school_df.to_excel(excel_filename, index=True)
-                        # Add the generated Excel file to the zip archive
-                        zippedObj.write(excel_filename, basename(excel_filename))
-                        # Clean up: remove the individual Excel file after adding to zip
-                        pathlib.Path(excel_filename).unlink()
-
-                    # Close zipfile object
-                    zippedObj.close()
-
-                    # Provide download link for the zipped summaries
-                    with open("srte_summaries.zip", "rb") as fin:
-                        zip_base64 = base64.b64encode(fin.read()).decode("utf-8")
-
-                    content_canvas.markdown(
-                        zipsummaries(zip_base64, "srte_summaries.zip"),
-                        unsafe_allow_html=True,
-                    )
+                        # Render each school's analyzed data to an Excel workbook
+                        excel_buffer = io.BytesIO()
+                        school_df.to_excel(excel_buffer, index=True)
+                        summaries[f"{school_name}.xlsx"] = excel_buffer.getvalue()
 
-                    # Clean up: remove the zip file itself
-                    pathlib.Path("srte_summaries.zip").unlink()
+                    # Provide download button for the zipped summaries
+                    zipsummaries(content_canvas, zip_files(summaries), "srte_summaries.zip")
 
             else:
                 display = content_canvas.info("Upload the raw SRTE data file to continue...")
@@ -190,23 +174,16 @@ def main():
             summary_file = sl.file_uploader("Upload SRTE Summary file (Excel)...", type=["xlsx"], key="sum_file")
             comment_file = sl.file_uploader("Upload SRTE Comment file (Excel)...", type=["xlsx"], key="com_file")
 
-            header_col = [
-                    "Course Title",
-                    "Lecturer Name",
-                    "Course likes", # Assuming this is column 2 (index 2) for extract_likes
-                    "Course dislikes" # Assuming this is column 3 (index 3) for extract_dislikes
-                ]
-
             if summary_file is not None and comment_file is not None:
                 # read files to dataframe
                 sum_data = read_summary_data(summary_file)
                 com_data = read_comment_data(comment_file)
 
                 # Ensure comment data columns are correctly named for extractor
-                if len(com_data.columns) == len(header_col):
-                    com_data.columns = header_col
-                else:
-                    content_canvas.error(f"Error: Comment file has {len(com_data.columns)} columns, but {len(header_col)} columns were expected. Please check your comment file format.")
+                try:
+                    com_data = apply_header(com_data, COMMENT_HEADER, "comment file")
+                except ValueError as e:
+                    content_canvas.error(str(e))
                     sl.stop() # Stop execution if column mismatch
 
                 sl.session_state["dataset"] = sum_data # Storing summary data in session state
@@ -220,8 +197,28 @@ def main():
 
                     if unmatched_summary_lecturers:
                         sl.warning("Warning: Some lecturers in the uploaded summary file were not found in the database:")
+                        suggestions = suggest_lecturer_matches(unmatched_summary_lecturers)
+                        resolutions = {}
                         for name in sorted(unmatched_summary_lecturers):
-                            sl.write(f"- {name}")
+                            if suggestions.get(name):
+                                # Let the officer confirm one of the proposed matches
+                                choice = sl.selectbox(
+                                    f"- {name}",
+                                    ["Leave unmatched"] + [official for official, _ in suggestions[name]],
+                                    format_func=lambda option, scores=dict(suggestions[name]): (
+                                        f"{option} ({scores[option]:.2f})" if option in scores else option
+                                    ),
+                                    key=f"resolve_{name}",
+                                )
+                                if choice != "Leave unmatched":
+                                    resolutions[name] = choice
+                            else:
+                                sl.write(f"- {name}")
+
+                        if resolutions and sl.button("Save selected matches", key="save_aliases_button"):
+                            # Remembered for future uploads; the rerun re-standardizes with them
+                            record_aliases(resolutions)
+                            sl.rerun()
                         sl.markdown("Please update your lecturer database for full consistency.")
                     else:
                         sl.success("Lecturers in summary data standardized successfully or no new names found.")
@@ -248,6 +245,14 @@ def main():
                         "Check this box to generate only one Lecturer's report", key="single_lecturer_checkbox"
                     )
                     
+                    workers = 1
+                    if not checked:
+                        # Reports are independent, so a batch can be split across processes
+                        workers = int(sl.number_input(
+                            "Parallel workers", min_value=1, max_value=os.cpu_count() or 1,
+                            value=1, step=1, key="report_workers_input",
+                        ))
+
                     lecturer = None # Initialize lecturer variable
                     if checked:
                         lecturer = col3.text_input("Enter Lecturer name (Standardized name expected!)", key="lecturer_name_input")
@@ -266,72 +271,37 @@ def main():
                         content_canvas.error("Please enter the lecturer's name if you checked to generate a single report.")
                         sl.stop()
                     
-                    # Generate reports
+                    # Generate reports in memory; nothing is written to the working directory
                     if checked:
                         # Generate report for a single lecturer
-                        # generate_lec_report will receive the already standardized sum_data
-                        generate_lec_report(
+                        # render_lec_reports will receive the already standardized sum_data
+                        reports = render_lec_reports(
                             sum_data, com_data, semester, session, lecturer
                         )
 
-                        # Get PDF files in current directory
-                        pdf_file_path = glob.glob(os.path.join(os.getcwd(), "*.pdf"))
-
-                        if not pdf_file_path:
+                        if not reports:
                             content_canvas.warning("No PDF reports were generated. Check the lecturer name or data.")
                         else:
-                            # Make files available for download and remove from current directory
-                            for report_path in pdf_file_path:
+                            # Make reports available for download
+                            for report_file, report_bytes in reports.items():
                                 # Extract the file name
-                                report_name = pathlib.Path(report_path).stem # Gets name without extension
-                                
-                                # Read pdf file and convert to base64 string
-                                with open(report_path, "rb") as pdf_file:
-                                    pdf_base64 = base64.b64encode(pdf_file.read()).decode("utf-8")
-
-                                content_canvas.markdown(
-                                    reportdownload(pdf_base64, report_name),
-                                    unsafe_allow_html=True,
-                                )
-                                content_canvas.success(f"Report for {report_name} generated!")
+                                report_name = pathlib.Path(report_file).stem # Gets name without extension
 
-                                # Clean up: remove the individual PDF file
-                                pathlib.Path(report_path).unlink()
+                                reportdownload(content_canvas, report_bytes, report_name)
+                                content_canvas.success(f"Report for {report_name} generated!")
 
                     else:
                         # Generate reports for all lecturers
-                        # generate_lec_report will receive the already standardized sum_data
-                        generate_lec_report(sum_data, com_data, semester, session)
-                        content_canvas.success("All lecturer reports generated and bundled into a zip file!")
+                        # render_lec_reports will receive the already standardized sum_data
+                        reports = render_lec_reports(sum_data, com_data, semester, session, workers=workers)
 
-                        # Get PDF files in current directory
-                        pdf_file_path = glob.glob(os.path.join(os.getcwd(), "*.pdf"))
-
-                        if not pdf_file_path:
+                        if not reports:
                             content_canvas.warning("No PDF reports were generated for all lecturers. Check your data.")
                         else:
-                            # Create a zip file object
-                            zippedObj = ZipFile("srte_reports.zip", "w")
-
-                            # Add files to zip and remove from directory
-                            for report_path in pdf_file_path:
-                                zippedObj.write(report_path, basename(report_path)) # Add to zip
-                                pathlib.Path(report_path).unlink() # Remove original PDF
-
-                            # Close zipfile object
-                            zippedObj.close()
-
-                            # Provide download link for the zipped reports
-                            with open("srte_reports.zip", "rb") as fin:
-                                zip_base64 = base64.b64encode(fin.read()).decode("utf-8")
-
-                            content_canvas.markdown(
-                                zipdownload(zip_base64, "srte_reports.zip"),
-                                unsafe_allow_html=True,
-                            )
+                            content_canvas.success("All lecturer reports generated and bundled into a zip file!")
 
-                            # Clean up: remove the zip file itself
-                            pathlib.Path("srte_reports.zip").unlink()
+                            # Provide download button for the zipped reports
+                            zipdownload(content_canvas, zip_files(reports), "srte_reports.zip")
 
             else:
                 display = content_canvas.info(
@@ -359,4 +329,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Report workers are separate processes; needed when the app is frozen on Windows
+    multiprocessing.freeze_support()
     main()
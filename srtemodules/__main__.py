@@ -0,0 +1,142 @@
+"""
+Command-line entry point for unattended SRTE runs.
+
+    python -m srtemodules analyze RAW.xlsx -o OUTPUT_DIR [--state STATE_FILE | --chunk-rows ROWS]
+    python -m srtemodules reports SUMMARY.xlsx COMMENTS.xlsx --session 2025/2026 --semester FIRST -o OUTPUT_DIR -j 4
+"""
+import argparse
+import os
+import sys
+import time
+
+from srtemodules.analysis_state import analyze_chunks, analyze_state, update_analysis_state
+from srtemodules.analyzer import analyze
+from srtemodules.data_loader import (
+    COMMENT_HEADER, apply_header, iter_raw_chunks, read_comment_data, read_summary_data,
+)
+from srtemodules.data_standardizer import standardize_lecturer_data, suggest_lecturer_matches
+from srtemodules.lecturers_reporter_ref import render_lec_reports, zip_files
+from srtemodules.response_matrix import ResponseMatrix
+
+
+def run_analyze(args):
+    """Analyzes a raw data file and writes one summary workbook per school."""
+    started = time.perf_counter()
+    if args.chunk_rows:
+        # Out of core: only one chunk and the per-group statistics are held at a time
+        results = analyze_chunks(iter_raw_chunks(args.raw_file, args.chunk_rows))
+        return _write_summaries(results, args.output_dir, started)
+
+    # Batches go straight into the compact matrix; the full frame is never built
+    responses = ResponseMatrix.from_batches(iter_raw_chunks(args.raw_file))
+    if args.state:
+        # Fold the new responses into the semester's running statistics and
+        # summarize everything folded in so far
+        results = analyze_state(update_analysis_state(responses, args.state))
+    else:
+        results = analyze(responses)
+    return _write_summaries(results, args.output_dir, started)
+
+
+def _write_summaries(results, output_dir, started):
+    os.makedirs(output_dir, exist_ok=True)
+    for school_name, school_df in results.items():
+        school_df.to_excel(os.path.join(output_dir, f"{school_name}.xlsx"), index=True)
+
+    print(f"Wrote {len(results)} school summaries to {output_dir} "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def run_reports(args):
+    """Generates the lecturer reports of a summary and comment file."""
+    started = time.perf_counter()
+    sum_data = read_summary_data(args.summary_file)
+    com_data = apply_header(read_comment_data(args.comment_file), COMMENT_HEADER, "comment file")
+
+    sum_data, unmatched_lecturers = standardize_lecturer_data(sum_data)
+    if unmatched_lecturers:
+        print("Warning: Some lecturers in the summary file were not found in the database:")
+        suggestions = suggest_lecturer_matches(unmatched_lecturers)
+        for name in sorted(unmatched_lecturers):
+            print(f"- {name}")
+            if suggestions.get(name):
+                print("    Possible matches: " + ", ".join(f"{official} ({score:.2f})" for official, score in suggestions[name]))
+
+    reports = render_lec_reports(
+        sum_data, com_data, args.semester, args.session, args.lecturer, args.workers
+    )
+    if not reports:
+        print("No PDF reports were generated. Check the lecturer name or data.")
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.zip:
+        with open(os.path.join(args.output_dir, "srte_reports.zip"), "wb") as zip_file:
+            zip_file.write(zip_files(reports))
+    else:
+        for name, data in reports.items():
+            with open(os.path.join(args.output_dir, name), "wb") as pdf_file:
+                pdf_file.write(data)
+
+    print(f"Wrote {len(reports)} reports to {args.output_dir} "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m srtemodules",
+        description="Run SRTE analysis and report generation without the web app.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    analyze_parser = commands.add_parser("analyze", help="analyze a raw SRTE data file")
+    analyze_parser.add_argument("raw_file", help="raw SRTE data file (.xlsx, .csv or .parquet)")
+    analyze_parser.add_argument("-o", "--output-dir", default=".",
+                                help="folder for the per-school summaries (default: current folder)")
+    analyze_parser.add_argument("--state", metavar="STATE_FILE",
+                                help="fold the file's responses into this running analysis state "
+                                     "(e.g. srte_analysis_state.npz) and summarize all responses "
+                                     "folded in so far; a file already folded in is skipped, and "
+                                     "each file must only hold new responses")
+    analyze_parser.add_argument("--chunk-rows", type=int, metavar="ROWS",
+                                help="analyze out of core, reading ROWS rows at a time")
+    analyze_parser.set_defaults(run=run_analyze)
+
+    reports_parser = commands.add_parser("reports", help="generate lecturer reports")
+    reports_parser.add_argument("summary_file", help="SRTE summary Excel file")
+    reports_parser.add_argument("comment_file", help="SRTE comment Excel file")
+    reports_parser.add_argument("--session", required=True, help="academic session, e.g. 2025/2026")
+    reports_parser.add_argument("--semester", required=True, help="semester, e.g. FIRST")
+    reports_parser.add_argument("--lecturer", help="only report on this (standardized) lecturer name")
+    reports_parser.add_argument("-o", "--output-dir", default=".",
+                                help="folder for the reports (default: current folder)")
+    reports_parser.add_argument("-j", "--workers", type=int, default=1,
+                                help="processes used to render an all-lecturer run (default: 1)")
+    reports_parser.add_argument("--zip", action="store_true",
+                                help="write a single srte_reports.zip instead of separate PDFs")
+    reports_parser.set_defaults(run=run_reports)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", 1) < 1:
+        parser.error("--workers must be at least 1")
+    if getattr(args, "chunk_rows", None) is not None and args.chunk_rows < 1:
+        parser.error("--chunk-rows must be at least 1")
+    if getattr(args, "chunk_rows", None) and args.state:
+        parser.error("--chunk-rows cannot be combined with --state")
+
+    try:
+        return args.run(args)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+import os
+import sqlite3
+from datetime import datetime
+
+# Local store of lecturer-name resolutions confirmed in the app. Rows are only ever
+# appended; the most recent resolution of a raw name wins when the store is loaded.
+ALIAS_STORE_FILE = "lecturer_aliases.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learned_aliases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    alias_key TEXT NOT NULL,
+    raw_name TEXT NOT NULL,
+    official_name TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+
+def normalize_alias(raw_name):
+    """Returns the key a raw lecturer name is stored and looked up under."""
+    return str(raw_name).strip().lower()
+
+
+def _connect(file_path):
+    connection = sqlite3.connect(file_path)
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def record_alias(raw_name, official_name, file_path=ALIAS_STORE_FILE):
+    """
+    Appends a confirmed resolution of `raw_name` to `official_name`.
+
+    Args:
+        raw_name (str): The lecturer name as it appeared in the uploaded data.
+        official_name (str): The official name it resolves to.
+        file_path (str): Path of the SQLite alias store (created if missing).
+    """
+    record_aliases({raw_name: official_name}, file_path)
+
+
+def record_aliases(resolutions, file_path=ALIAS_STORE_FILE):
+    """
+    Appends several confirmed resolutions in one transaction.
+
+    Args:
+        resolutions (dict): Raw lecturer name -> official name.
+        file_path (str): Path of the SQLite alias store (created if missing).
+    """
+    created_at = datetime.now().isoformat(timespec='seconds')
+    rows = [
+        (normalize_alias(raw_name), str(raw_name).strip(), official_name, created_at)
+        for raw_name, official_name in resolutions.items()
+    ]
+    connection = _connect(file_path)
+    try:
+        with connection:
+            connection.executemany(
+                "INSERT INTO learned_aliases (alias_key, raw_name, official_name, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+    finally:
+        connection.close()
+
+
+def load_aliases(file_path=ALIAS_STORE_FILE):
+    """
+    Loads the learned aliases.
+
+    Args:
+        file_path (str): Path of the SQLite alias store.
+
+    Returns:
+        dict: Normalized raw name -> official name of its latest resolution
+              (empty if the store does not exist or cannot be read).
+    """
+    if not os.path.exists(file_path):
+        return {}
+
+    try:
+        connection = _connect(file_path)
+    except sqlite3.Error as e:
+        print(f"Error opening lecturer alias store: {e}")
+        return {}
+    try:
+        rows = connection.execute(
+            "SELECT alias_key, official_name FROM learned_aliases ORDER BY id"
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"Error reading lecturer alias store: {e}")
+        return {}
+    finally:
+        connection.close()
+
+    # Later rows overwrite earlier ones, so the latest resolution wins
+    return dict(rows)
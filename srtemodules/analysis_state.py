@@ -0,0 +1,244 @@
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from srtemodules.analyzer import (
+    GROUP_KEYS, ITEM_COLUMNS, build_summary, group_item_statistics, report_unmatched_lecturers,
+    standardize_responses,
+)
+from srtemodules.data_standardizer import standardize_lecturer_data
+from srtemodules.response_matrix import ResponseMatrix
+
+# Running per-(course, lecturer) statistics of the responses analyzed so far in a
+# semester, so each new wave of responses is folded in instead of re-analyzing all
+ANALYSIS_STATE_FILE = "srte_analysis_state.npz"
+
+# Stored in the state file; states written in another format are not loaded
+ANALYSIS_STATE_FORMAT_VERSION = 1
+
+
+def _collapse(groups, *arrays):
+    """Sorts `groups` and adds up the rows of `arrays` that share a group."""
+    codes, uniques = groups.factorize(sort=True)
+    uniques = uniques.set_names(GROUP_KEYS)
+    collapsed = []
+    for array in arrays:
+        total = np.zeros((len(uniques), array.shape[1]), dtype=array.dtype)
+        np.add.at(total, codes, array)
+        collapsed.append(total)
+    return (uniques, *collapsed)
+
+
+class GroupStatistics:
+    """
+    Sufficient statistics of every (Course Title, Lecturer Name) group: per item,
+    the sum, the number and the sum of squares of the scores given. Statistics of
+    separate response batches merge by adding arrays, and the summary scores are
+    derived from them on demand.
+
+    Group keys are kept as strings, so they compare equal across saved batches.
+    """
+
+    def __init__(self, groups, sums, counts, sums_of_squares, batch_hashes=()):
+        """
+        Args:
+            groups (pd.MultiIndex): The sorted (Course Title, Lecturer Name) groups.
+            sums (np.ndarray): Per-group item sums, shape (groups, items).
+            counts (np.ndarray): Per-group non-missing item counts, shape (groups, items).
+            sums_of_squares (np.ndarray): Per-group item sums of squares, shape (groups, items).
+            batch_hashes (tuple): Content hashes of the response batches folded in
+                                  (see ResponseMatrix.content_hash).
+        """
+        self.groups = groups
+        self.sums = sums
+        self.counts = counts
+        self.sums_of_squares = sums_of_squares
+        self.batch_hashes = tuple(batch_hashes)
+
+    @classmethod
+    def empty(cls):
+        groups = pd.MultiIndex.from_arrays([[], []], names=GROUP_KEYS)
+        shape = (0, len(ITEM_COLUMNS))
+        return cls(groups, np.zeros(shape), np.zeros(shape, dtype=np.int64), np.zeros(shape))
+
+    @classmethod
+    def from_responses(cls, responses):
+        """
+        Accumulates the statistics of a response batch.
+
+        Args:
+            responses (ResponseMatrix): The responses; lecturer names are kept as given.
+        """
+        groups, sums, counts, sums_of_squares = group_item_statistics(responses, squares=True)
+        # Course titles read as numbers become strings, so batches line up
+        groups = pd.MultiIndex.from_arrays(
+            [groups.get_level_values(key).astype(str) for key in GROUP_KEYS]
+        )
+        return cls(*_collapse(groups, sums, counts, sums_of_squares))
+
+    def __len__(self):
+        return len(self.groups)
+
+    def merge(self, other):
+        """Returns the statistics of both response sets together."""
+        groups = self.groups.append(other.groups)
+        return GroupStatistics(*_collapse(
+            groups,
+            np.concatenate([self.sums, other.sums]),
+            np.concatenate([self.counts, other.counts]),
+            np.concatenate([self.sums_of_squares, other.sums_of_squares]),
+        ), batch_hashes=self.batch_hashes + other.batch_hashes)
+
+    def rename_lecturers(self, names):
+        """
+        Returns the statistics with the lecturer names mapped through `names`
+        (old name -> new name); groups that end up with the same name are merged.
+        """
+        lecturers = self.groups.get_level_values("Lecturer Name")
+        renamed = pd.MultiIndex.from_arrays([
+            self.groups.get_level_values("Course Title"),
+            lecturers.map(lambda name: names.get(name, name)).astype(str),
+        ])
+        return GroupStatistics(
+            *_collapse(renamed, self.sums, self.counts, self.sums_of_squares),
+            batch_hashes=self.batch_hashes,
+        )
+
+    def item_std(self):
+        """Returns the per-group (population) standard deviation of every item, NaN if unanswered."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.sums / self.counts
+            variance = self.sums_of_squares / self.counts - means * means
+        return np.sqrt(np.clip(variance, 0, None))
+
+    def save(self, file_path=ANALYSIS_STATE_FILE):
+        """Writes the statistics to `file_path`, replacing it atomically."""
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                format=np.array(ANALYSIS_STATE_FORMAT_VERSION),
+                items=np.array(ITEM_COLUMNS, dtype=str),
+                courses=np.array(self.groups.get_level_values("Course Title"), dtype=str),
+                lecturers=np.array(self.groups.get_level_values("Lecturer Name"), dtype=str),
+                sums=self.sums,
+                counts=self.counts,
+                sums_of_squares=self.sums_of_squares,
+                batch_hashes=np.array(self.batch_hashes, dtype=str),
+            )
+        os.replace(tmp_path, file_path)
+
+
+def load_analysis_state(file_path=ANALYSIS_STATE_FILE):
+    """
+    Loads the running statistics.
+
+    Returns:
+        GroupStatistics: The saved statistics, or empty ones if the file does not
+                         exist or was written in another format.
+
+    Raises:
+        ValueError: If the file cannot be read, e.g. because it is corrupt.
+    """
+    if not os.path.exists(file_path):
+        return GroupStatistics.empty()
+
+    try:
+        with np.load(file_path, allow_pickle=False) as data:
+            if int(data["format"]) != ANALYSIS_STATE_FORMAT_VERSION or list(data["items"]) != ITEM_COLUMNS:
+                print(f"Warning: Ignoring analysis state {file_path} written in another format.")
+                return GroupStatistics.empty()
+            groups = pd.MultiIndex.from_arrays(
+                [data["courses"].astype(object), data["lecturers"].astype(object)], names=GROUP_KEYS
+            )
+            # States saved before batch hashes were recorded have none
+            batch_hashes = data["batch_hashes"].tolist() if "batch_hashes" in data.files else ()
+            return GroupStatistics(
+                groups, data["sums"], data["counts"], data["sums_of_squares"], batch_hashes
+            )
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        raise ValueError(f"Error: Could not read analysis state {file_path}: {e}")
+
+
+def update_analysis_state(df, file_path=ANALYSIS_STATE_FILE):
+    """
+    Folds a batch of new responses into the saved statistics. The cost depends on
+    the batch and the number of groups, not on the responses folded in before.
+
+    The content hash of every folded batch is saved with the statistics, and a
+    batch identical to one already folded in (e.g. a retried run) is skipped.
+    Batches overlapping an earlier one, such as cumulative exports, are not
+    detected and must not be folded in.
+
+    Args:
+        df (ResponseMatrix or pd.DataFrame): The new raw responses.
+        file_path (str): The state file (created if missing).
+
+    Returns:
+        GroupStatistics: The updated statistics, as saved.
+    """
+    responses = df if isinstance(df, ResponseMatrix) else ResponseMatrix.from_frame(df)
+    batch_hash = responses.content_hash()
+    state = load_analysis_state(file_path)
+    if batch_hash in state.batch_hashes:
+        print(f"Warning: These responses were already folded into {file_path}; skipping them.")
+        return state
+
+    responses, _ = standardize_responses(responses)
+    batch = GroupStatistics.from_responses(responses)
+    batch.batch_hashes = (batch_hash,)
+    state = state.merge(batch)
+    state.save(file_path)
+    return state
+
+
+def analyze_state(state, report_unmatched=False):
+    """
+    Derives the per-school summary tables from running statistics, as analyze()
+    returns them for the same responses.
+
+    The lecturer names are standardized again against the current database, so
+    aliases learned since a batch was folded in join their lecturer's groups.
+
+    Args:
+        state (GroupStatistics): The accumulated statistics.
+        report_unmatched (bool): Print the lecturer names the database does not know.
+    """
+    lecturers = pd.DataFrame({
+        "Lecturer Name": pd.Series(state.groups.get_level_values("Lecturer Name").unique(), dtype=object)
+    })
+    if report_unmatched:
+        print("Standardizing lecturer names and affiliations...")
+    standardized_lecturers, unmatched_lecturers = standardize_lecturer_data(lecturers)
+    if report_unmatched:
+        report_unmatched_lecturers(unmatched_lecturers)
+
+    state = state.rename_lecturers(
+        dict(zip(lecturers["Lecturer Name"], standardized_lecturers["Lecturer Name"]))
+    )
+    return build_summary(state.groups, state.sums, state.counts, standardized_lecturers)
+
+
+def analyze_chunks(chunks):
+    """
+    Out-of-core analyze(): accumulates the group statistics chunk by chunk and
+    returns the same per-school summary tables as analyze() on all the rows. Only
+    one chunk and the per-group statistics are in memory at a time.
+
+    Lecturer names are standardized once, over the distinct names of all chunks,
+    after the last chunk.
+
+    Args:
+        chunks (iterable): Raw response chunks, as DataFrames with the RAW_DATA_HEADER
+                           columns or ResponseMatrix objects (e.g. from iter_raw_chunks).
+
+    Returns:
+        dict: School name -> DataFrame of that school's analyzed results.
+    """
+    state = GroupStatistics.empty()
+    for chunk in chunks:
+        responses = chunk if isinstance(chunk, ResponseMatrix) else ResponseMatrix.from_frame(chunk)
+        state = state.merge(GroupStatistics.from_responses(responses))
+    return analyze_state(state, report_unmatched=True)
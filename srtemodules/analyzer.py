@@ -1,350 +1,253 @@
 import os
 import numpy as np
 import pandas as pd
-from srtemodules.data_standardizer import standardize_lecturer_data # Import the new function
+from srtemodules.data_standardizer import REGISTRY_VERSION_COLUMN, standardize_lecturer_data, suggest_lecturer_matches
+from srtemodules.coursecode import load_course_registry
+from srtemodules.response_matrix import ResponseMatrix
 
-def analyze(df):
+# Columns used to group responses into one summary row per course and lecturer.
+GROUP_KEYS = ["Course Title", "Lecturer Name"]
+
+# Questionnaire items belonging to each SRTE category, in column order.
+CATEGORY_ITEMS = {
+    "TM": ["TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7"],
+    "TA": ["TA8", "TA9", "TA10", "TA11", "TA12"],
+    "CM": ["CM13", "CM14", "CM15", "CM16"],
+    "IF": ["IF17", "IF18", "IF19", "IF20", "IF21"],
+    "PTA": ["PTA22", "PTA23"],
+}
+ITEM_COLUMNS = [item for items in CATEGORY_ITEMS.values() for item in items]
+
+
+def group_item_statistics(srte, squares=False):
     """
-    Performs SRTE analysis, including lecturer data standardization and categorization
-    by school.
+    Groups the responses once by course and lecturer and accumulates, for every
+    item column, the sum and the number of non-missing scores in each group.
 
     Args:
-        df (pd.DataFrame): The raw input DataFrame containing SRTE data.
+        srte (ResponseMatrix or pd.DataFrame): Responses; a DataFrame needs the
+                                               GROUP_KEYS and ITEM_COLUMNS columns.
+        squares (bool): Also accumulate the per-group sums of squared scores.
 
     Returns:
-        dict: A dictionary where keys are school names (e.g., "SMS", "VASSS")
-              and values are DataFrames containing the analyzed results for that school.
+        tuple: A tuple containing:
+            - pd.MultiIndex: The sorted (Course Title, Lecturer Name) groups.
+            - np.ndarray: Per-group item sums, shape (groups, items).
+            - np.ndarray: Per-group non-missing item counts, shape (groups, items).
+            - np.ndarray: Per-group item sums of squares, shape (groups, items);
+                          only when `squares` is True.
     """
-    # --- STEP 1: Standardize Lecturer Data ---
-    # Call the standardization function first.
-    # It will use 'Lecturer database.xlsx - Sheet1.csv' internally.
-    # Pass a copy of the DataFrame to avoid modifying the original 'df' outside this function's scope
-    # if 'df' is used elsewhere before 'analyze'.
-    print("Standardizing lecturer names and affiliations...")
-    standardized_df, unmatched_lecturers = standardize_lecturer_data(df.copy())
+    if not isinstance(srte, ResponseMatrix):
+        srte = ResponseMatrix.from_frame(srte)
+
+    # Rows with a missing course or lecturer are dropped, as groupby() would do.
+    course_codes = srte.courses.codes.astype(np.int64)
+    lecturer_codes = srte.lecturers.codes.astype(np.int64)
+    valid = (course_codes >= 0) & (lecturer_codes >= 0)
+
+    # Number the distinct (course, lecturer) code pairs, then order them by name
+    n_lecturers = len(srte.lecturers.categories)
+    pairs, pair_of_row = np.unique(
+        course_codes[valid] * n_lecturers + lecturer_codes[valid], return_inverse=True
+    )
+    pair_index = pd.MultiIndex.from_arrays([
+        srte.courses.categories.take(pairs // n_lecturers),
+        srte.lecturers.categories.take(pairs % n_lecturers),
+    ])
+    pair_codes, groups = pair_index.factorize(sort=True)
+    groups = groups.set_names(GROUP_KEYS)
+    codes = pair_codes[pair_of_row.ravel()]
+    n_groups = len(groups)
+
+    sums = np.empty((n_groups, len(ITEM_COLUMNS)), dtype=np.float64)
+    counts = np.empty((n_groups, len(ITEM_COLUMNS)), dtype=np.int64)
+    sums_of_squares = np.empty((n_groups, len(ITEM_COLUMNS)), dtype=np.float64) if squares else None
+    for j, item in enumerate(ITEM_COLUMNS):
+        scores, present = srte.item_scores(item)
+        scores = scores[valid]
+        sums[:, j] = np.bincount(codes, weights=scores, minlength=n_groups)
+        counts[:, j] = np.bincount(codes, weights=present[valid], minlength=n_groups)
+        if squares:
+            sums_of_squares[:, j] = np.bincount(codes, weights=scores * scores, minlength=n_groups)
+
+    if squares:
+        return groups, sums, counts, sums_of_squares
+    return groups, sums, counts
+
+
+def compute_scores(groups, sums, counts):
+    """
+    Derives the category means, percentages, ES and N for every group from the
+    per-group item sums and counts.
+
+    Args:
+        groups (pd.MultiIndex): The (Course Title, Lecturer Name) groups.
+        sums (np.ndarray): Per-group item sums in ITEM_COLUMNS order.
+        counts (np.ndarray): Per-group non-missing item counts in ITEM_COLUMNS order.
 
+    Returns:
+        pd.DataFrame: One row per group with the "<category> Overall", "<category> %",
+                      "ES Overall", "ES %" and "No" columns.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        item_means = sums / counts  # NaN where an item has no responses in a group
+
+    columns = {}
+    overall_total = np.zeros(len(groups), dtype=np.float64)
+    start = 0
+    for category, items in CATEGORY_ITEMS.items():
+        means = item_means[:, start:start + len(items)]
+        start += len(items)
+
+        # Average of the item means, ignoring items nobody answered
+        answered = ~np.isnan(means)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            overall = np.where(answered, means, 0.0).sum(axis=1) / answered.sum(axis=1)
+        if category == "PTA":
+            # PTA items are percentages; bring them onto the 5-point scale
+            overall = (overall / 100) * 5
+
+        overall = overall.round(2)
+        columns[f"{category} Overall"] = overall
+        columns[f"{category} %"] = ((overall / 5) * 100).round(1)
+        overall_total += overall
+
+    es = overall_total / len(CATEGORY_ITEMS)
+    columns["ES Overall"] = es.round(2)
+    columns["ES %"] = ((es / 5) * 100).round(1)
+    columns["No"] = counts[:, ITEM_COLUMNS.index("TM1")]
+
+    return pd.DataFrame(columns, index=groups)
+
+def split_by_school(result):
+    """
+    Splits the analyzed results into one DataFrame per school, using the longest
+    course-code prefix match of each 'Course Title' in the course registry.
+
+    Args:
+        result (pd.DataFrame): Analyzed results indexed by 'Course Title'.
+
+    Returns:
+        dict: School name -> DataFrame of that school's rows, in registry order.
+              Schools without courses are omitted, as are courses matching no prefix.
+    """
+    registry = load_course_registry()
+
+    # Classify each distinct course code once and broadcast back to the rows
+    codes, titles = pd.factorize(result.index)
+    title_schools = np.array(
+        [registry.trie.longest_match(str(title)) for title in titles], dtype=object
+    )
+    row_schools = title_schools[codes] if len(titles) else np.empty(0, dtype=object)
+
+    by_school = {
+        school: rows
+        for school, rows in result.groupby(row_schools, sort=False, dropna=True)
+    }
+    return {school: by_school[school] for school in registry.schools if school in by_school}
+
+
+def report_unmatched_lecturers(unmatched_lecturers):
+    """Prints the lecturer names the database does not know, with suggested matches."""
     if unmatched_lecturers:
         print("\n--- WARNING: UNMATCHED LECTURERS FOUND ---")
         print("The following lecturer names from the raw data were not found in the lecturer database:")
+        suggestions = suggest_lecturer_matches(unmatched_lecturers)
         for name in sorted(unmatched_lecturers):
             print(f"- {name}")
+            if suggestions.get(name):
+                print("    Possible matches: " + ", ".join(f"{official} ({score:.2f})" for official, score in suggestions[name]))
         print("Please consider adding them or their aliases to your 'Lecturer database.xlsx - Sheet1.csv' file.")
         print("-------------------------------------------\n")
     else:
         print("All lecturer names standardized successfully or no new names found.")
 
 
-    # --- STEP 2: Continue with existing SRTE analysis using the standardized DataFrame ---
-    srte = standardized_df.copy() # Use the standardized DataFrame for all subsequent operations
+def standardize_responses(responses):
+    """
+    Standardizes the lecturer names of a response set, printing the names the
+    lecturer database does not know with their suggested matches.
 
-    # Your existing column definitions and drops:
-    # These sections will now operate on the DataFrame where 'Lecturer Name',
-    # 'Department', and 'School' (if present in original 'df') have been standardized.
+    Only the distinct lecturer names are standardized; the responses then take
+    their lecturer's standardized name through the categorical codes.
 
-    tm = srte.columns[2:9]
-    ta = srte.columns[9:14]
-    cm = srte.columns[14:18]
-    ifs = srte.columns[18:23]
-    pta = srte.columns[23:25]
+    Args:
+        responses (ResponseMatrix): The raw responses.
 
-    tm = srte.drop(
-        [
-            "TA8", "TA9", "TA10", "TA11", "TA12", "CM13", "CM14", "CM15", "CM16",
-            "IF17", "IF18", "IF19", "IF20", "IF21", "PTA22", "PTA23",
-        ],
-        axis="columns",
-    )
+    Returns:
+        tuple: A tuple containing:
+            - ResponseMatrix: The responses with standardized lecturer names.
+            - pd.DataFrame: One row per distinct raw lecturer, with the standardized
+                            'Lecturer Name', 'Department' and 'School' (see
+                            standardize_lecturer_data).
+    """
+    # Call the standardization function first.
+    # It will use 'Lecturer database.xlsx - Sheet1.csv' internally.
+    print("Standardizing lecturer names and affiliations...")
+    standardized_lecturers, unmatched_lecturers = standardize_lecturer_data(responses.lecturer_frame())
 
-    ta = srte.drop(
-        [
-            "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7", "CM13", "CM14", "CM15", "CM16",
-            "IF17", "IF18", "IF19", "IF20", "IF21", "PTA22", "PTA23",
-        ],
-        axis="columns",
-    )
+    report_unmatched_lecturers(unmatched_lecturers)
 
-    cm = srte.drop(
-        [
-            "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7", "TA8", "TA9", "TA10", "TA11", "TA12",
-            "IF17", "IF18", "IF19", "IF20", "IF21", "PTA22", "PTA23",
-        ],
-        axis="columns",
-    )
+    return responses.with_lecturers(standardized_lecturers["Lecturer Name"]), standardized_lecturers
 
-    ifs = srte.drop(
-        [
-            "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7", "TA8", "TA9", "TA10", "TA11", "TA12",
-            "CM13", "CM14", "CM15", "CM16", "PTA22", "PTA23",
-        ],
-        axis="columns",
-    )
 
-    pta = srte.drop(
-        [
-            "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7", "TA8", "TA9", "TA10", "TA11", "TA12",
-            "CM13", "CM14", "CM15", "CM16", "IF17", "IF18", "IF19", "IF20", "IF21",
-        ],
-        axis="columns",
-    )
+def build_summary(groups, sums, counts, standardized_lecturers):
+    """
+    Turns per-group item statistics into the per-school summary tables.
+
+    Args:
+        groups (pd.MultiIndex): The (Course Title, Lecturer Name) groups.
+        sums (np.ndarray): Per-group item sums in ITEM_COLUMNS order.
+        counts (np.ndarray): Per-group non-missing item counts in ITEM_COLUMNS order.
+        standardized_lecturers (pd.DataFrame): Standardized 'Lecturer Name',
+                                               'Department' and 'School' rows, as
+                                               returned by standardize_lecturer_data.
 
-    # These groupings will now use the standardized 'Lecturer Name'
-    tm = tm.groupby(["Course Title", "Lecturer Name"]).mean()
-    tm["TM Overall"] = tm.apply(np.mean, axis=1)
-    tm["TM Overall"] = tm["TM Overall"].round(2)
-    tm["TM %"] = (tm["TM Overall"] / 5) * 100
-    tm["TM %"] = tm["TM %"].round(1)
-    tm = tm.drop(["TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7"], axis="columns")
-
-    ta = ta.groupby(["Course Title", "Lecturer Name"]).mean()
-    ta["TA Overall"] = ta.apply(np.mean, axis=1)
-    ta["TA Overall"] = ta["TA Overall"].round(2)
-    ta["TA %"] = (ta["TA Overall"] / 5) * 100
-    ta["TA %"] = ta["TA %"].round(1)
-    ta = ta.drop(["TA8", "TA9", "TA10", "TA11", "TA12"], axis="columns")
-
-    cm = cm.groupby(["Course Title", "Lecturer Name"]).mean()
-    cm["CM Overall"] = cm.apply(np.mean, axis=1)
-    cm["CM Overall"] = cm["CM Overall"].round(2)
-    cm["CM %"] = (cm["CM Overall"] / 5) * 100
-    cm["CM %"] = cm["CM %"].round(1)
-    cm = cm.drop(["CM13", "CM14", "CM15", "CM16"], axis="columns")
-
-    ifs = ifs.groupby(["Course Title", "Lecturer Name"]).mean()
-    ifs["IF Overall"] = ifs.apply(np.mean, axis=1)
-    ifs["IF Overall"] = ifs["IF Overall"].round(2)
-    ifs["IF %"] = (ifs["IF Overall"] / 5) * 100
-    ifs["IF %"] = ifs["IF %"].round(1)
-    ifs = ifs.drop(["IF17", "IF18", "IF19", "IF20", "IF21"], axis="columns")
-
-    pta = pta.groupby(["Course Title", "Lecturer Name"]).mean()
-    pta["PTA Overall"] = (pta.apply(np.mean, axis=1) / 100) * 5
-    pta["PTA Overall"] = pta["PTA Overall"].round(2)
-    pta["PTA %"] = (pta["PTA Overall"] / 5) * 100
-    pta["PTA %"] = pta["PTA %"].round(1)
-    pta = pta.drop(["PTA22", "PTA23"], axis="columns")
-
-    ts = (
-        tm["TM Overall"]
-        + ta["TA Overall"]
-        + cm["CM Overall"]
-        + ifs["IF Overall"]
-        + pta["PTA Overall"]
-    ) / 5
-    tsp = (ts / 5) * 100
-    pta["ES Overall"] = ts
-    pta["ES Overall"] = pta["ES Overall"].round(2)
-    pta["ES %"] = tsp
-    pta["ES %"] = pta["ES %"].round(1)
-
-    srt = srte.groupby(["Course Title", "Lecturer Name"]).count()
-    pta["No"] = srt["TM1"]
-
-    frame = [tm, ta, cm, ifs, pta]
-
-    result = pd.concat(frame, axis=1, join="inner", sort=False)
+    Returns:
+        dict: School name -> DataFrame of that school's analyzed results.
+    """
+    result = compute_scores(groups, sums, counts)
 
     result = result.reset_index("Lecturer Name")
 
-    # The 'School' and 'Department' columns will now be updated in 'result'
-    # due to the standardization, assuming they were part of the initial 'df'
-    # or you add them as part of the analysis process after standardization.
-    # If not present in the original 'df', you might need to merge them back
-    # into 'result' from 'standardized_df' based on 'Lecturer Name' and 'Course Title'.
-    # For now, I'll assume they are handled by the initial standardization.
-
-    def analyse_comp():
-        results = {}
-
-        # The filtering logic here will operate on the 'Course Title' index
-        # This remains unchanged, as lecturer standardization doesn't directly
-        # impact course titles.
-        sms = result[
-            (result.index.str.startswith("ACCT")) | (result.index.str.startswith("BSAD")) |
-            (result.index.str.startswith("BSTA")) | (result.index.str.startswith("BMTH")) |
-            (result.index.str.startswith("FNCE")) | (result.index.str.startswith("IRMA")) |
-            (result.index.str.startswith("MLIS")) | (result.index.str.startswith("MIHM")) |
-            (result.index.str.startswith("BSAD/MKTG")) | (result.index.str.startswith("MBIM")) |
-            (result.index.str.startswith("ECONS")) | (result.index.str.startswith("MKTG")) |
-            (result.index.str.startswith("AMS")) | (result.index.str.startswith("'BU-ACC")) |
-            (result.index.str.startswith("BUA")) | (result.index.str.startswith("BU-BSD")) |
-            (result.index.str.startswith("MCON")) | (result.index.str.startswith("MHIM")) |
-            (result.index.str.startswith("BU-IRM")) | (result.index.str.startswith("BU-IRMA")) |
-            (result.index.str.startswith("BU-MKT")) | (result.index.str.startswith("BU-BSD")) |
-            (result.index.str.startswith("MKT")) | (result.index.str.startswith("IRM")) |
-            (result.index.str.startswith("ENT")) | (result.index.str.startswith("BU-BUA")) |
-            (result.index.str.startswith("BSD")) | (result.index.str.startswith("BU-FIN")) |
-            (result.index.str.startswith("FIN")) | (result.index.str.startswith("IIRM"))
-        ]
-        if len(sms.index) != 0:
-            results["SMS"] = sms
-
-        vasss = result[
-            (result.index.str.startswith("ECON")) | (result.index.str.startswith("MCOM")) |
-            (result.index.str.startswith("MCBC")) | (result.index.str.startswith("MCJP")) |
-            (result.index.str.startswith("MCPR")) | (result.index.str.startswith("PBAD")) |
-            (result.index.str.startswith("PBMG")) | (result.index.str.startswith("PLSC")) |
-            (result.index.str.startswith("IILDP")) | (result.index.str.startswith("ILDP")) |
-            (result.index.str.startswith("PMBG")) | (result.index.str.startswith("SOWK")) |
-            (result.index.str.startswith("CMS")) | (result.index.str.startswith("MCM")) |
-            (result.index.str.startswith("BU-ILD")) | (result.index.str.startswith("BU-POL")) |
-            (result.index.str.startswith("POL")) | (result.index.str.startswith("BU-ECO")) |
-            (result.index.str.startswith("BU-SWK")) | (result.index.str.startswith("BU-PAD")) |
-            (result.index.str.startswith("BU-CMS")) | (result.index.str.startswith("BU-MCM")) |
-            (result.index.str.startswith("BU-POL")) | (result.index.str.startswith("ILD-POL")) |
-            (result.index.str.startswith("BU-ILDP")) | (result.index.str.startswith("SWK")) |
-            (result.index.str.startswith("SOC")) | (result.index.str.startswith("SWMP")) |
-            (result.index.str.startswith("SWFC")) | (result.index.str.startswith("SWSA")) |
-            (result.index.str.startswith("PBMR")) | (result.index.str.startswith("PAD")) |
-            (result.index.str.startswith("BU-SOWK"))
-        ]
-        if len(vasss.index) != 0:
-            results["VASSS"] = vasss
-
-        cffs = result[
-            (result.index.str.startswith("MAT")) | (result.index.str.startswith("LIT")) |
-            (result.index.str.startswith("PHY")) | (result.index.str.startswith("CHE")) |
-            (result.index.str.startswith("ECO")) | (result.index.str.startswith("BIO")) |
-            (result.index.str.startswith("PPAD")) | (result.index.str.startswith("PILW")) |
-            (result.index.str.startswith("CRS")) | (result.index.str.startswith("GOV")) |
-            (result.index.str.startswith("ECN")) | (result.index.str.startswith("ACC")) |
-            (result.index.str.startswith("BUS")) | (result.index.str.startswith("HIS")) |
-            (result.index.str.startswith("AGR"))
-        ]
-        if len(cffs.index) != 0:
-            results["CFFS"] = cffs
-
-        eah = result[
-            (result.index.str.startswith("BEDU")) | (result.index.str.startswith("CRLS")) |
-            (result.index.str.startswith("CRSL")) | (result.index.str.startswith("CHMN")) |
-            (result.index.str.startswith("CHIS")) | (result.index.str.startswith("EDPA")) |
-            (result.index.str.startswith("EDUC")) | (result.index.str.startswith("ENGL")) |
-            (result.index.str.startswith("FRCH")) | (result.index.str.startswith("GCPY")) |
-            (result.index.str.startswith("GEDS")) | (result.index.str.startswith("HIST")) |
-            (result.index.str.startswith("MUSC")) | (result.index.str.startswith("RELS")) |
-            (result.index.str.startswith("RELG")) | (result.index.str.startswith("EGLT")) |
-            (result.index.str.startswith("BIBL")) | (result.index.str.startswith("NTST")) |
-            (result.index.str.startswith("OTST")) | (result.index.str.startswith("THST")) |
-            (result.index.str.startswith("FREN")) | (result.index.str.startswith("BU/GST")) |
-            (result.index.str.startswith("BU-GST")) | (result.index.str.startswith("BU-CRS")) |
-            (result.index.str.startswith("BU-GEDS")) | (result.index.str.startswith("PRDE")) |
-            (result.index.str.startswith("GES")) | (result.index.str.startswith("GST")) |
-            (result.index.str.startswith("GET")) | (result.index.str.startswith("BU-HIS")) |
-            (result.index.str.startswith("MUS")) | (result.index.str.startswith("PSY")) |
-            (result.index.str.startswith("BU-LIT")) | (result.index.str.startswith("BU-MUS")) |
-            (result.index.str.startswith("FAC")) | (result.index.str.startswith("BU-GST")) |
-            (result.index.str.startswith("CGPY")) | (result.index.str.startswith("RELG"))
-        ]
-        if len(eah.index) != 0:
-            results["EAH"] = eah
-
-        pah = result[
-            (result.index.str.startswith("MLSC")) | (result.index.str.startswith("PHSC")) |
-            (result.index.str.startswith("MLSB")) | (result.index.str.startswith("MLSH")) |
-            (result.index.str.startswith("MLSM")) | (result.index.str.startswith("MLSP")) |
-            (result.index.str.startswith("PHFC")) | (result.index.str.startswith("PHMP")) |
-            (result.index.str.startswith("PHEP")) | (result.index.str.startswith("PHNT")) |
-            (result.index.str.startswith("PHPR")) | (result.index.str.startswith("PHEH")) |
-            (result.index.str.startswith("ENGL/EGLT")) | (result.index.str.startswith("PHHP")) |
-            (result.index.str.startswith("MLS")) | (result.index.str.startswith("BU-MLS"))
-        ]
-        if len(pah.index) != 0:
-            results["PAH"] = pah
-
-        nursing = result[
-            (result.index.str.startswith("NRSG")) | (result.index.str.startswith("COS")) |
-            (result.index.str.startswith("NSC")) | (result.index.str.startswith("BU-NSC")) |
-            (result.index.str.startswith("RSG"))
-        ]
-        if len(nursing.index) != 0:
-            results["NURSING"] = nursing
-
-        ces = result[
-            (result.index.str.startswith("COSC")) | (result.index.str.startswith("INSY")) |
-            (result.index.str.startswith("ITGY")) | (result.index.str.startswith("ELCT")) |
-            (result.index.str.startswith("SENG")) | (result.index.str.startswith("IFT")) |
-            (result.index.str.startswith("SEN")) | (result.index.str.startswith("BU-CSC")) |
-            (result.index.str.startswith("BU-SEN")) | (result.index.str.startswith("INS")) |
-            (result.index.str.startswith("BU-IFT")) | (result.index.str.startswith("CYB")) |
-            (result.index.str.startswith("BU-ENG")) | (result.index.str.startswith("BU-CSC")) |
-            (result.index.str.startswith("BU-SEN"))
-        ]
-        if len(ces.index) != 0:
-            results["CES"] = ces
-
-        sat = result[
-            (result.index.str.startswith("AGRE")) | (result.index.str.startswith("AGEM")) |
-            (result.index.str.startswith("AGRY")) | (result.index.str.startswith("AGRI")) |
-            (result.index.str.startswith("ANSC")) | (result.index.str.startswith("CRPT")) |
-            (result.index.str.startswith("BIOL")) | (result.index.str.startswith("BOTA")) |
-            (result.index.str.startswith("CHEM")) | (result.index.str.startswith("ICHEM")) |
-            (result.index.str.startswith("ELCT")) | (result.index.str.startswith("MATH")) |
-            (result.index.str.startswith("STAT")) | (result.index.str.startswith("MBIO")) |
-            (result.index.str.startswith("NUDT")) | (result.index.str.startswith("ZOOL")) |
-            (result.index.str.startswith("ZOO")) | (result.index.str.startswith("PHYS")) |
-            (result.index.str.startswith("BU-CHM")) | (result.index.str.startswith("BU-BIO")) |
-            (result.index.str.startswith("EVMT")) | (result.index.str.startswith("BU-AGG")) |
-            (result.index.str.startswith("STA/STAT")) | (result.index.str.startswith("BU-AGR")) |
-            (result.index.str.startswith("BOT")) | (result.index.str.startswith("BU-BIO")) |
-            (result.index.str.startswith("BU-BTG")) | (result.index.str.startswith("BU-CHM")) |
-            (result.index.str.startswith("CSC")) | (result.index.str.startswith("STA")) |
-            (result.index.str.startswith("BU-MCB")) | (result.index.str.startswith("MCB")) |
-            (result.index.str.startswith("AGG"))
-        ]
-        if len(sat.index) != 0:
-            results["SAT"] = sat
-
-        bcsm = result[
-            (result.index.str.startswith("ANAT")) | (result.index.str.startswith("BCHM")) |
-            (result.index.str.startswith("MBBT")) | (result.index.str.startswith("PATH")) |
-            (result.index.str.startswith("EPDM")) | (result.index.str.startswith("PHGY")) |
-            (result.index.str.startswith("Internal")) | (result.index.str.startswith("Surgery")) |
-            (result.index.str.startswith("Level")) | (result.index.str.startswith("OBGYN")) |
-            (result.index.str.startswith("400")) | (result.index.str.startswith("Batch")) |
-            (result.index.str.startswith("SURG")) | (result.index.str.startswith("PAED")) | 
-            (result.index.str.startswith("Junior")) 
-        ]
-        if len(bcsm.index) != 0:
-            results["BCSM"] = bcsm
-
-        sbms = result[
-            (result.index.str.startswith("COMH")) | (result.index.str.startswith("MBBS")) |
-            (result.index.str.startswith("CHM")) | (result.index.str.startswith("NUT")) |
-            (result.index.str.startswith("BU-NUT")) | (result.index.str.startswith("ANA")) |
-            (result.index.str.startswith("BCH")) | (result.index.str.startswith("PHS")) |
-            (result.index.str.startswith("BU-PIO")) | (result.index.str.startswith("PIO")) |
-            (result.index.str.startswith("BU-ANA")) | (result.index.str.startswith("BU-BCH"))
-        ]
-        if len(sbms.index) != 0:
-            results["SBMS"] = sbms
-
-        law = result[
-            (result.index.str.startswith("LAWS")) | (result.index.str.startswith("DCSS")) |
-            (result.index.str.startswith("LAW")) | (result.index.str.startswith("BU-PUL")) |
-            (result.index.str.startswith("CIL")) | (result.index.str.startswith("PHL")) |
-            (result.index.str.startswith("PUL")) | (result.index.str.startswith("BU-CIL"))
-        ]
-        if len(law.index) != 0:
-            results["LAW"] = law
-
-        sces = result[
-            (result.index.str.startswith("Elct")) | (result.index.str.startswith("MTH")) |
-            (result.index.str.startswith("BU/CPE")) | (result.index.str.startswith("MEE")) |
-            (result.index.str.startswith("CEE")) | (result.index.str.startswith("BU-CPE")) |
-            (result.index.str.startswith("INGY"))
-        ]
-        if len(sces.index) != 0:
-            results["SCES"] = sces
-
-        return results
-
-    # The rest of your analyzer.py (analyse_comp function and its calls)
-    # remains largely the same, but it will now operate on the `srte` DataFrame
-    # which has been standardized.
-
-    return analyse_comp()
-
-    # The commented out sections for saving to Excel in analyser.py
-    # would also use the standardized data if uncommented.
-
-    # print("SRTE analysis completed successfully...")
+    # Carry the standardized affiliation and the lecturer database version into the
+    # summary, so the Generate Reports path can skip re-standardizing it.
+    if REGISTRY_VERSION_COLUMN in standardized_lecturers.attrs:
+        affiliations = (
+            standardized_lecturers.dropna(subset=["Lecturer Name"])
+            .drop_duplicates("Lecturer Name")
+            .set_index("Lecturer Name")[["Department", "School"]]
+        )
+        result = result.join(affiliations, on="Lecturer Name")
+        result[REGISTRY_VERSION_COLUMN] = standardized_lecturers.attrs[REGISTRY_VERSION_COLUMN]
+
+    # The split operates on the 'Course Title' index, which lecturer
+    # standardization does not touch.
+    return split_by_school(result)
+
+
+def analyze(df):
+    """
+    Performs SRTE analysis, including lecturer data standardization and categorization
+    by school.
+
+    Args:
+        df (ResponseMatrix or pd.DataFrame): The raw SRTE responses. A DataFrame is
+                                             converted to a ResponseMatrix first.
+
+    Returns:
+        dict: A dictionary where keys are school names (e.g., "SMS", "VASSS")
+              and values are DataFrames containing the analyzed results for that school.
+    """
+    responses = df if isinstance(df, ResponseMatrix) else ResponseMatrix.from_frame(df)
+
+    # --- STEP 1: Standardize Lecturer Data ---
+    responses, standardized_lecturers = standardize_responses(responses)
+
+    # --- STEP 2: Score every (course, lecturer) group in a single pass ---
+    # The item columns are grouped once and every category figure is derived
+    # from the per-group sums and counts.
+    groups, sums, counts = group_item_statistics(responses)
 
+    # --- STEP 3: Derive the scores and split the results by school ---
+    return build_summary(groups, sums, counts, standardized_lecturers)
@@ -1,15 +1,25 @@
 import pandas as pd
 import numpy as np
 import re
-from collections import Counter
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
 from textblob import TextBlob # New import for sentiment analysis
 
+from srtemodules.sentiment_store import lookup_polarities, store_polarities
+
+# Maximum number of distinct comments whose polarity is kept in memory
+SENTIMENT_CACHE_SIZE = 65536
+
 # List of common "empty" comment indicators (case-insensitive)
 EMPTY_COMMENT_PATTERNS = re.compile(
     r'^(nan|nil|none|nothing|nill|n/a|n/c|noting else|nun)$',
     re.IGNORECASE
 )
 
+# Hyphens, enumerations such as "1. " and runs of punctuation, removed from every comment
+COMMENT_NOISE_PATTERN = re.compile(r'\-|\d\.\s|[.?_!*]+')
+
 def _clean_single_comment(comment_text):
     """Helper function to clean a single comment string."""
     if pd.isna(comment_text):
@@ -23,7 +33,7 @@ def _clean_single_comment(comment_text):
 
     # Remove hyphens, numbers followed by a period and space (e.g., "1. "),
     # and various punctuation marks.
-    comment_text = re.sub(r'\-|\d\.\s|[.?_!*]+', '', comment_text)
+    comment_text = COMMENT_NOISE_PATTERN.sub('', comment_text)
     
     # Replace common "empty" words/phrases (case-insensitive)
     if EMPTY_COMMENT_PATTERNS.match(comment_text):
@@ -31,6 +41,32 @@ def _clean_single_comment(comment_text):
 
     return comment_text.strip() # Strip again after regex operations
 
+def clean_comments(series):
+    """
+    Cleans a whole column of comments at once, applying the same rules as
+    _clean_single_comment with vectorized string methods. Repeated comments
+    are cleaned once and broadcast back to their rows.
+    Returns a Series of cleaned strings ('' for empty comments), aligned with `series`.
+    """
+    # Factorize the string form, so e.g. 5 and 5.0 are still cleaned as '5' and '5.0'
+    missing = series.isna().to_numpy()
+    codes, uniques = pd.factorize(series.astype(str))
+    text = pd.Series(uniques, dtype=object).str.strip()
+
+    # Numbers only (e.g. '0', '1', '2') count as empty
+    digits_only = text.str.isdigit()
+
+    text = text.str.replace(COMMENT_NOISE_PATTERN, '', regex=True)
+    empty_words = text.str.match(EMPTY_COMMENT_PATTERNS)
+
+    cleaned = text.str.strip().to_numpy(dtype=object, copy=True)
+    cleaned[(digits_only | empty_words).to_numpy(dtype=bool)] = ''
+
+    # Missing comments become '' (code -1 picks the appended '')
+    cleaned = np.append(cleaned, '').take(codes)
+    cleaned[missing] = ''
+    return pd.Series(cleaned, index=series.index, dtype=object)
+
 def get_comments(df, columns):
     """
     Extracts and cleans comments from specified DataFrame columns.
@@ -38,8 +74,8 @@ def get_comments(df, columns):
     """
     comments = []
     for col in columns:
-        # Apply the cleaner function to each cell in the column
-        df.loc[:, col] = df[col].apply(_clean_single_comment)
+        # Clean the whole column at once
+        df[col] = clean_comments(df[col])
         comments.extend(df[col].tolist()) # Add all cleaned comments to the list
 
     # Filter out any remaining empty strings that might result from cleaning
@@ -49,8 +85,8 @@ def get_series(series):
     """
     Extracts and cleans comments from a single Pandas Series.
     """
-    # Apply the cleaner function to each cell in the series
-    cleaned_series = series.apply(_clean_single_comment)
+    # Clean the whole series at once
+    cleaned_series = clean_comments(series)
     
     # Filter out any remaining empty strings
     return [c for c in cleaned_series.tolist() if c]
@@ -80,6 +116,63 @@ def cleanitup(x):
                 g.append(str(r).strip()) # Only strip, no capitalize
     return g
 
+def normalize_comment(text):
+    """
+    Returns the key a comment is scored under: the text with whitespace collapsed.
+    Case is kept, as TextBlob scores some tokens (e.g. emoticons like ':D') by case.
+    """
+    return ' '.join(str(text).split())
+
+# In-process LRU of normalized comment -> polarity, in front of the on-disk store.
+# Streamlit runs every session in its own thread, so it is only used under the lock.
+_polarity_memo = OrderedDict()
+_polarity_lock = threading.Lock()
+
+def comment_polarities(normalized_comments):
+    """
+    Returns the TextBlob polarity of each distinct normalized comment.
+
+    Comments are looked up in the in-process LRU first, then in bulk in the
+    persistent sentiment store; only comments found in neither are run through
+    TextBlob, and their polarities are saved to the store for later runs.
+    """
+    polarities = {}
+    missing = []
+    with _polarity_lock:
+        for comment in set(normalized_comments):
+            if comment in _polarity_memo:
+                _polarity_memo.move_to_end(comment)
+                polarities[comment] = _polarity_memo[comment]
+            else:
+                missing.append(comment)
+
+    if missing:
+        try:
+            stored = lookup_polarities(missing)
+        except sqlite3.Error as e:
+            print(f"Warning: Sentiment store unavailable, scoring comments in memory only: {e}")
+            stored = None
+
+        computed = {
+            comment: TextBlob(comment).sentiment.polarity
+            for comment in missing
+            if stored is None or comment not in stored
+        }
+        if stored is not None and computed:
+            try:
+                store_polarities(computed)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not save comment sentiment: {e}")
+
+        for comment in missing:
+            polarities[comment] = computed[comment] if comment in computed else stored[comment]
+        with _polarity_lock:
+            _polarity_memo.update((comment, polarities[comment]) for comment in missing)
+            while len(_polarity_memo) > SENTIMENT_CACHE_SIZE:
+                _polarity_memo.popitem(last=False)
+
+    return polarities
+
 def analyze_sentiment(text, polarity_override=None): # Added polarity_override for average sentiment
     """
     Analyzes the sentiment of a given text or uses an override polarity.
@@ -90,8 +183,8 @@ def analyze_sentiment(text, polarity_override=None): # Added polarity_override f
     if polarity_override is not None:
         polarity = polarity_override
     else:
-        analysis = TextBlob(text)
-        polarity = analysis.sentiment.polarity
+        normalized_text = normalize_comment(text)
+        polarity = comment_polarities([normalized_text])[normalized_text]
 
     if polarity > 0.1: # Slightly positive threshold
         category = 'Positive'
@@ -107,30 +200,28 @@ def get_aggregated_comments_with_sentiment(comment_list):
     including sentiment analysis.
     Returns a list of (formatted_comment_string, polarity, category) tuples.
     """
-    # Dictionary to store counts, original comment text, and sentiment
-    # Key: normalized comment (lowercase, stripped)
-    # Value: [count, original_comment_text, total_polarity, num_comments_for_avg_polarity]
-    aggregated = {}
+    # Score each distinct spelling once
+    normalized_comments = [normalize_comment(comment) for comment in comment_list]
+    polarities = comment_polarities(normalized_comments)
 
-    for comment in comment_list:
-        normalized_comment = comment.lower()
-        polarity, _ = analyze_sentiment(comment) # Get sentiment for each individual comment
-
-        if normalized_comment in aggregated:
-            aggregated[normalized_comment][0] += 1
-            aggregated[normalized_comment][2] += polarity # Sum polarities for average
-            aggregated[normalized_comment][3] += 1
-        else:
-            aggregated[normalized_comment] = [1, comment, polarity, 1]
+    # Identical comments (case-insensitive) are grouped under one key, keeping the
+    # first spelling seen for display and averaging the polarity of every spelling
+    counts = Counter()
+    original_texts = {}
+    total_polarities = {}
+    for comment, normalized_comment in zip(comment_list, normalized_comments):
+        key = comment.lower()
+        counts[key] += 1
+        original_texts.setdefault(key, comment)
+        total_polarities[key] = total_polarities.get(key, 0.0) + polarities[normalized_comment]
 
-    # Convert to a list of (original_comment, count, avg_polarity, avg_category) tuples
+    # Convert to a list of (original_comment, count, polarity, category) tuples
     # Sort by count (descending), then by original comment text (alphabetical, case-insensitive)
     sorted_comments_with_sentiment = []
-    for k, v in aggregated.items():
-        count, original_text, total_polarity, num_comments = v
-        avg_polarity = total_polarity / num_comments
-        _, avg_category = analyze_sentiment(original_text, avg_polarity) # Use avg_polarity to get category
-        sorted_comments_with_sentiment.append((original_text, count, avg_polarity, avg_category))
+    for key, count in counts.items():
+        original_text = original_texts[key]
+        polarity, category = analyze_sentiment(original_text, total_polarities[key] / count)
+        sorted_comments_with_sentiment.append((original_text, count, polarity, category))
 
     sorted_comments_with_sentiment = sorted(
         sorted_comments_with_sentiment,
@@ -168,3 +259,36 @@ def extract_dislikes(df, filter_course):
     dislikes_column = df.columns[3]
     cleaned_comments = get_comments(filter_course.copy(), [dislikes_column])
     return get_aggregated_comments_with_sentiment(cleaned_comments)
+
+# Returned for a (lecturer, course) pair with no comments at all
+NO_COMMENTS = {'likes': ([], []), 'dislikes': ([], [])}
+
+def build_comment_index(df):
+    """
+    Cleans, groups and aggregates a whole comment frame once, so a report batch can
+    look up each (lecturer, course) page instead of rescanning the frame.
+
+    Args:
+        df (pd.DataFrame): Comment data with 'Lecturer Name' and 'Course Title' columns,
+                           likes in the third column and dislikes in the fourth.
+
+    Returns:
+        dict: (Lecturer Name, Course Title) -> {'likes': (formatted, polarities),
+              'dislikes': (formatted, polarities)}, as returned by extract_likes and
+              extract_dislikes for that course.
+    """
+    likes = clean_comments(df[df.columns[2]]).to_numpy()
+    dislikes = clean_comments(df[df.columns[3]]).to_numpy()
+
+    # Score every distinct comment of the batch in one bulk pass; the per-page
+    # aggregation below then only hits the in-process cache
+    comment_polarities([normalize_comment(c) for c in set(likes) | set(dislikes) if c])
+
+    index = {}
+    groups = df.groupby(['Lecturer Name', 'Course Title'], sort=False).indices
+    for key, rows in groups.items():
+        index[key] = {
+            'likes': get_aggregated_comments_with_sentiment([c for c in likes[rows] if c]),
+            'dislikes': get_aggregated_comments_with_sentiment([c for c in dislikes[rows] if c]),
+        }
+    return index
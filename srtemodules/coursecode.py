@@ -1,187 +1,83 @@
-courses = [
-    'ACCT',
-    'BSAD',
-    'BSTA',
-    'BMTH',
-    'FNCE',
-    'IRMA',
-    'MLIS',
-    'MKTG',
-    'ECON',
-    'MCOM',
-    'MCBC',
-    'MCJP',
-    'MCPR',
-    'PBAD',
-    'PBMG',
-    'PLSC',
-    'IILDP',
-    'SOWK',
-    'BEDU',
-    'CRLS',
-    'CHMN',
-    'CHIS',
-    'EDPA',
-    'EDUC',
-    'ENGL',
-    'FRCH',
-    'GCPY',
-    'GEDS',
-    'HIST',
-    'MUSC',
-    'RELS',
-    'FREN',
-    'MLSC',
-    'PHSC',
-    'MLSB',
-    'MLSH',
-    'MLSM',
-    'MLSP',
-    'PHFC',
-    'NRSG',
-    'COSC',
-    'INSY',
-    'ITGY',
-    'ELCT',
-    'SENG',
-    'AGRE',
-    'AGEM',
-    'AGRY',
-    'AGRI',
-    'ANSC',
-    'CRPT',
-    'BIOL',
-    'BOTA',
-    'CHEM',
-    'ELCT',
-    'MATH',
-    'STAT',
-    'MBIO',
-    'NUDT',
-    'PHYS',
-    'ANAT',
-    'BCHM',
-    'MBBT',
-    'PATH',
-    'EPDM',
-    'PHGY',
-    'Internal',
-    'Surgery',
-    'Level',
-    'Batch',
-    'LAWS',
-    'EGLT',
-    'BIBL',
-    'NTST',
-    'OTST',
-    'THST',
-    'PHMP',
-    'PHEP',
-    'PHNT',
-    'PHPR',
-    'PHEH',
-    'ENGL/EGLT',
-    'COMH',
-    'MBBS',
-    'Elct',
-    'MIHM',
-    'BSAD/MKTG',
-    'MBIM',
-    'ECONS',
-    'PMBG',
-    'ILDP',
-    'BIO', 
-    'CRS', 
-    'PHY', 
-    'CHE', 
-    'MAT', 
-    'LIT', 
-    'ECO', 
-    'GOV', 
-    'BUS', 
-    'HIS', 
-    'ACC', 
-    'AGR',
-    "LAW", 
-    "ICHEM", 
-    "ZOOL", 
-    "ZOO", 
-    "CRSL",
-    "DCSS",
-    "OBGYN", 'BU', 'BU/CPE', 
-    'BU/GST', 'BU-GST', 'GES', 
-    'GET', 'GST', 'BU-HIS', 'MUS', 
-    'MTH', 'AMS', 'BU-ACC', 'BUA', 'BU-BSD', 
-    'MCON', 'MHIM', 'MRAM', 'BU-IRM', 'BU-IRMA', 
-    'PHHP', 'CHM', 'CMS', 'MCM', 'BU-ILD', 'BU-POL', 
-    'POL', 'BU-MKT', 'MKT', 'MEE', 'CEE', 'BU-ECO', 
-    'IRM', 'COS', 'NSC', 'NUT', 'BU-PAD','BU-SWK',
-    'BU-CRS','BU-GEDS','PRDE', 'SURG', 'EVMT','BU-AGG', 'STA/STAT',
-    'ENT', 'BU-LIT',
-    'BU-MUS',
-    'FAC',
-    'BU-PUL',
-    'CIL',
-    'PHL',
-    'PSY',
-    'PUL',
-    'BCH',
-    'BU-MCB',
-    'MCB',
-    'BOT',
-    'BU-BIO',
-    'BU-BTG',
-    'BU-CHM',
-    'BU-MTH',
-    'CSC',
-    'STA',
-    'BU-AGR',
-    'ANA',
-    'BU-NUT',
-    'PHS',
-    'BU-PIO',
-    'PIO',
-    'SEN',
-    'IFT',
-    'BU-BUA',
-    'BSD',
-    'BU-FIN',
-    'FIN',
-    'BU-NSC',
-    'MLS',
-    'BU-CMS',
-    'BU-MCM',
-    'BU-POL',
-    'ILD-POL',
-    'BU-ILPD',
-    'BU-CPE',
-    'BU-GST',
-    'SWK',
-    'SOC',
-    'SWMP', 
-    'SWFC', 
-    'SWSA', 
-    'IIRM', 
-    'RSG', 
-    'PBMR', 
-    'CGPY',
-    'INGY',
-    'RELG',
-    'BU-ANA',
-    'BU-CSC', 
-    'BU-SEN', 
-    'INS', 
-    'BU-IFT', 
-    'CYB', 
-    'BU-ENG', 
-    'BU-CIL', 
-    'BU-BCH', 
-    'BU-MLS',
-    'AGG', 
-    'PAD',
-    'BU-SOWK',
-    'BU-CSC',
-    'BU-SEN',
-    'Junior',
-    'PAED',
-]
\ No newline at end of file
+import os
+from collections import namedtuple
+
+import pandas as pd
+
+from srtemodules.prefix_trie import PrefixTrie
+
+# Registry of known course-code prefixes and the school/department offering them.
+# Add or move a prefix by editing this file; no code change is needed.
+COURSE_REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "course_prefixes.csv")
+
+CourseRegistry = namedtuple("CourseRegistry", ["prefixes", "info", "schools", "trie"])
+CourseRegistry.__doc__ = """
+Compiled course-code registry.
+
+    prefixes (frozenset): Every known course-code prefix.
+    info (dict): Prefix -> {'School': ..., 'Department': ...}.
+    schools (tuple): School names in the order they first appear in the registry file.
+    trie (PrefixTrie): Prefix -> school, for longest-prefix classification of course codes.
+"""
+
+# (file path, mtime, size) -> CourseRegistry, so an edited registry file is picked up
+# on the next call without restarting the app.
+_registry_cache = {}
+
+
+def load_course_registry(file_path=COURSE_REGISTRY_FILE):
+    """
+    Loads and compiles the course-code registry, reusing the compiled copy while
+    the file is unchanged.
+
+    Args:
+        file_path (str): Path to a CSV file with 'Prefix', 'School' and 'Department' columns.
+                         'School' and 'Department' may be blank for prefixes that are
+                         known but not assigned to a school.
+
+    Returns:
+        CourseRegistry: The compiled registry (empty if the file cannot be loaded).
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        print(f"Error: Course registry file not found at {file_path}.")
+        return CourseRegistry(frozenset(), {}, (), PrefixTrie())
+
+    cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    registry = _registry_cache.get(cache_key)
+    if registry is not None:
+        return registry
+
+    try:
+        registry_df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+    except Exception as e:
+        print(f"Error loading course registry: {e}")
+        return CourseRegistry(frozenset(), {}, (), PrefixTrie())
+
+    info = {}
+    schools = {}  # dict used as an ordered set
+    trie = PrefixTrie()
+    for prefix, school, department in zip(
+        registry_df["Prefix"].str.strip(),
+        registry_df["School"].str.strip(),
+        registry_df["Department"].str.strip(),
+    ):
+        if not prefix:
+            continue
+        if prefix in info:
+            print(f"Warning: Course prefix '{prefix}' is listed more than once in the course registry; keeping the first entry.")
+            continue
+
+        info[prefix] = {'School': school, 'Department': department}
+        if school:
+            schools.setdefault(school, None)
+            trie.insert(prefix, school)
+
+    registry = CourseRegistry(frozenset(info), info, tuple(schools), trie)
+    _registry_cache.clear()
+    _registry_cache[cache_key] = registry
+    return registry
+
+
+# Known course-code prefixes, kept for existing `from srtemodules.coursecode import courses` users.
+courses = load_course_registry().prefixes
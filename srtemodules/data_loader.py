@@ -0,0 +1,190 @@
+import os
+from itertools import chain, islice
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# Column names of the raw SRTE response data, in file order
+RAW_DATA_HEADER = [
+    "Course Title", "Lecturer Name", "TM1", "TM2", "TM3", "TM4", "TM5", "TM6", "TM7",
+    "TA8", "TA9", "TA10", "TA11", "TA12", "CM13", "CM14", "CM15", "CM16",
+    "IF17", "IF18", "IF19", "IF20", "IF21", "PTA22", "PTA23",
+]
+
+# Questionnaire item columns of the raw data; every other column is a key
+RAW_ITEM_COLUMNS = RAW_DATA_HEADER[2:]
+
+# Rows parsed into each DataFrame batch when streaming the raw data
+RAW_DATA_BATCH_ROWS = 50000
+
+# Column names of the comment data, in file order
+COMMENT_HEADER = [
+    "Course Title",
+    "Lecturer Name",
+    "Course likes", # Assuming this is column 2 (index 2) for extract_likes
+    "Course dislikes" # Assuming this is column 3 (index 3) for extract_dislikes
+]
+
+
+def _column_count_error(found, header, label):
+    return ValueError(
+        f"Error: The {label} has {found} columns, but {len(header)} columns "
+        f"were expected. Please check your {label} format."
+    )
+
+
+def _compact_items(batch):
+    """Casts the item columns of a raw data batch to float64, in place."""
+    # Non-numeric answers become NaN here rather than at analysis time. float64
+    # keeps fractional answers exact; ResponseMatrix narrows the scores further
+    # only where that is lossless
+    batch[RAW_ITEM_COLUMNS] = (
+        batch[RAW_ITEM_COLUMNS].apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    )
+    return batch
+
+
+def _raw_data_batch(rows):
+    """Builds one raw data DataFrame from projected rows, with float64 item columns."""
+    return _compact_items(pd.DataFrame.from_records(rows, columns=RAW_DATA_HEADER, nrows=len(rows)))
+
+
+def _row_width(row):
+    """Returns the number of cells of a sheet row, ignoring trailing empty cells."""
+    width = len(row)
+    while width and row[width - 1] is None:
+        width -= 1
+    return width
+
+
+def iter_raw_data(datafile, batch_rows=RAW_DATA_BATCH_ROWS):
+    """
+    Streams the raw SRTE data Excel file in batches, without loading the workbook's
+    full object model: the first sheet is read in openpyxl's read-only, values-only
+    mode, only the RAW_DATA_HEADER columns are kept, and item scores are made
+    numeric batch by batch.
+
+    Args:
+        datafile (str or file-like): The raw data workbook.
+        batch_rows (int): Maximum number of rows per batch.
+
+    Yields:
+        pd.DataFrame: Consecutive batches of rows, with RAW_DATA_HEADER columns.
+
+    Raises:
+        ValueError: If the sheet does not have the expected number of columns.
+    """
+    workbook = load_workbook(datafile, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        # Blank rows are skipped
+        rows = (row for row in rows if any(value is not None for value in row))
+
+        # As with pandas, the sheet is as wide as its widest row, so trailing
+        # columns with data but no header still count; the header and the first
+        # batch decide the width
+        first_batch = list(islice(rows, batch_rows))
+        full_width = max((_row_width(row) for row in [header, *first_batch]), default=0)
+
+        # Assuming the last two columns are not part of the core data
+        width = max(full_width - 2, 0)
+        if width != len(RAW_DATA_HEADER):
+            raise _column_count_error(width, RAW_DATA_HEADER, "raw data file")
+
+        # Project each row onto the expected columns
+        projected = (
+            row[:width] + (None,) * (width - len(row))
+            for row in chain(first_batch, rows)
+        )
+        while True:
+            batch = list(islice(projected, batch_rows))
+            if not batch:
+                break
+            yield _raw_data_batch(batch)
+    finally:
+        workbook.close()
+
+
+def _raw_chunk(chunk, label):
+    """Projects a raw data chunk read with its own header onto RAW_DATA_HEADER."""
+    # Assuming the last two columns are not part of the core data
+    width = max(len(chunk.columns) - 2, 0)
+    if width != len(RAW_DATA_HEADER):
+        raise _column_count_error(width, RAW_DATA_HEADER, label)
+    return _compact_items(chunk.iloc[:, :width].set_axis(RAW_DATA_HEADER, axis=1))
+
+
+def iter_raw_chunks(file_path, batch_rows=RAW_DATA_BATCH_ROWS):
+    """
+    Streams a raw SRTE data file in chunks of at most `batch_rows` rows, whatever
+    its format: Excel workbooks as in iter_raw_data, CSV files through the pandas
+    chunked reader and Parquet files row group by row group (needs pyarrow). The
+    file layout is the same as the Excel export's.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks with RAW_DATA_HEADER columns.
+    """
+    extension = os.path.splitext(str(file_path))[1].lower()
+    if extension == ".csv":
+        for chunk in pd.read_csv(file_path, chunksize=batch_rows):
+            yield _raw_chunk(chunk, "raw data file")
+    elif extension == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Reading Parquet raw data files needs the pyarrow package.")
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=batch_rows):
+            yield _raw_chunk(batch.to_pandas(), "raw data file")
+    else:
+        yield from iter_raw_data(file_path, batch_rows)
+
+
+def read_raw_data(datafile):
+    """
+    Reads the raw SRTE data Excel file into one DataFrame with RAW_DATA_HEADER
+    columns, streaming it as in iter_raw_data.
+    """
+    batches = list(iter_raw_data(datafile))
+    if not batches:
+        return _raw_data_batch([])
+    return pd.concat(batches, ignore_index=True)
+
+
+def read_comment_data(datafile):
+    """Reads the comments data Excel file."""
+    df = pd.read_excel(datafile)
+    # Assuming columns 2 to 25 are not comments
+    df = df.drop(df.columns[2:25], axis=1)
+    return df
+
+
+def read_summary_data(datafile):
+    """Reads the summary data Excel file."""
+    df = pd.read_excel(datafile)
+    # Drop rows with any NaN values; blank Department/School cells are allowed, as
+    # the analyzer leaves them empty for lecturers missing from the database
+    df = df.dropna(axis=0, subset=df.columns.difference(["Department", "School"]))
+    return df
+
+
+def apply_header(df, header, label):
+    """
+    Names the columns of a freshly read file.
+
+    Args:
+        df (pd.DataFrame): The data as read.
+        header (list): Expected column names, in file order.
+        label (str): How the file is referred to in the error message.
+
+    Returns:
+        pd.DataFrame: `df` with its columns renamed to `header`.
+
+    Raises:
+        ValueError: If `df` does not have exactly len(header) columns.
+    """
+    if len(df.columns) != len(header):
+        raise _column_count_error(len(df.columns), header, label)
+    df.columns = header
+    return df
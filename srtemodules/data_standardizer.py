@@ -1,19 +1,39 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
 import pandas as pd
 import re
 
-def load_lecturer_database(file_path="Lecturer database.xlsx - Sheet1.csv"):
-    """
-    Loads the lecturer database from a CSV file and prepares lookup dictionaries.
+from srtemodules.alias_store import ALIAS_STORE_FILE, load_aliases
+from srtemodules.lecturer_db import REGISTRY_FILE, get_registry
+from srtemodules.name_matcher import get_signature_index, get_trigram_index, name_signature
 
-    Args:
-        file_path (str): The path to the lecturer database CSV file.
+# Bump when the layout of the lookup dictionaries changes, so stale snapshots are ignored.
+SNAPSHOT_FORMAT_VERSION = 1
+# Suffix of the binary snapshot written next to the lecturer database CSV.
+SNAPSHOT_SUFFIX = ".snapshot.pkl"
 
-    Returns:
-        tuple: A tuple containing:
-            - dict: A dictionary mapping official lecturer names (lowercase) to their
-                    department and school information.
-            - dict: A dictionary mapping all aliases (including official names, lowercase)
-                    to their official standardized name.
+# Process-wide cache: (absolute path, mtime, size) -> (official_name_to_info, alias_to_official).
+# A changed file produces a new key, so edits are picked up automatically.
+_database_cache = {}
+# (base alias_to_official, alias store key, merged lookups) for the learned-alias merge.
+_merged_cache = (None, None, None)
+# Missing CSV paths already reported as falling back to the bundled registry.
+_registry_fallback_paths = set()
+
+# Records the lecturer database version a frame was standardized against, as a
+# DataFrame.attrs key and, in analyzer summaries, as a column that survives Excel.
+REGISTRY_VERSION_COLUMN = "Registry Version"
+# (alias_to_official the version was computed for, version)
+_version_cache = (None, None)
+
+
+def _parse_lecturer_database(file_path):
+    """
+    Parses the lecturer database CSV into the two lookup dictionaries.
+    Returns ({}, {}) if the file cannot be read or is missing required columns.
     """
     try:
         # Load the lecturer database directly from the provided CSV file
@@ -38,12 +58,12 @@ def load_lecturer_database(file_path="Lecturer database.xlsx - Sheet1.csv"):
     official_name_to_info = {}
     alias_to_official = {}
 
-    for _, row in lecturers_df.iterrows():
-        official_name = str(row['Official Name']).strip()
-        department = str(row['Department']).strip()
-        school = str(row['School']).strip()
-        aliases_str = str(row['Aliases']).strip() if pd.notna(row['Aliases']) else ""
-
+    for official_name, department, school, aliases_str in zip(
+        lecturers_df['Official Name'].astype(str).str.strip(),
+        lecturers_df['Department'].astype(str).str.strip(),
+        lecturers_df['School'].astype(str).str.strip(),
+        lecturers_df['Aliases'].fillna('').astype(str).str.strip(),
+    ):
         # Store official info, using lowercase official name as key for lookup
         official_name_to_info[official_name.lower()] = {
             'Department': department,
@@ -61,10 +81,195 @@ def load_lecturer_database(file_path="Lecturer database.xlsx - Sheet1.csv"):
 
     return official_name_to_info, alias_to_official
 
+
+def _read_snapshot(snapshot_path, source_key):
+    """Returns the lookup dictionaries stored in a snapshot built from `source_key`, or None."""
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+    if snapshot.get("format") != SNAPSHOT_FORMAT_VERSION or snapshot.get("source") != source_key:
+        return None
+    return snapshot["official_name_to_info"], snapshot["alias_to_official"]
+
+
+def _write_snapshot(snapshot_path, source_key, official_name_to_info, alias_to_official):
+    """Writes a binary snapshot of the lookup dictionaries. Failures only skip the snapshot."""
+    snapshot = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "source": source_key,
+        "official_name_to_info": official_name_to_info,
+        "alias_to_official": alias_to_official,
+    }
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"Warning: Could not write lecturer database snapshot to {snapshot_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_lecturer_database(file_path="Lecturer database.xlsx - Sheet1.csv", use_snapshot=True,
+                           alias_store_path=ALIAS_STORE_FILE):
+    """
+    Loads the lecturer database from a CSV file and prepares lookup dictionaries.
+
+    The dictionaries are cached per process and keyed on the file's path, mtime and
+    size, so repeated calls are free until the CSV changes. With `use_snapshot`, a
+    pickled copy is also kept next to the CSV (`<file_path>.snapshot.pkl`) and reused
+    by new processes instead of reparsing the CSV. If the CSV does not exist, the
+    bundled lecturer registry (srtemodules/lecturer_registry.npz) is used instead.
+
+    Name resolutions confirmed in the app (see srtemodules/alias_store.py) are merged
+    into the alias mapping.
+
+    Args:
+        file_path (str): The path to the lecturer database CSV file.
+        use_snapshot (bool): Whether to read and refresh the binary snapshot.
+        alias_store_path (str): The path to the learned-alias store.
+
+    Returns:
+        tuple: A tuple containing:
+            - dict: A dictionary mapping official lecturer names (lowercase) to their
+                    department and school information.
+            - dict: A dictionary mapping all aliases (including official names, lowercase)
+                    to their official standardized name.
+    """
+    lookups = _load_base_lookups(file_path, use_snapshot)
+    if not lookups[0]:
+        return lookups
+    return _merge_learned_aliases(lookups, alias_store_path)
+
+
+def _load_base_lookups(file_path, use_snapshot):
+    """Returns the lookup dictionaries of the CSV (or bundled registry), without learned aliases."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        if os.path.exists(REGISTRY_FILE):
+            # Reported once per process, not on every lookup
+            if file_path not in _registry_fallback_paths:
+                _registry_fallback_paths.add(file_path)
+                print(f"Lecturer database file not found at {file_path}; using the bundled lecturer registry.")
+            return get_registry().lookup_dicts()
+        print(f"Error: Lecturer database file not found at {file_path}. Please ensure the file exists in the same directory as this script.")
+        return {}, {}
+    except OSError as e:
+        print(f"Error loading lecturer database: {e}")
+        return {}, {}
+
+    source_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    cached = _database_cache.get(source_key)
+    if cached is not None:
+        return cached
+
+    snapshot_path = file_path + SNAPSHOT_SUFFIX
+    lookups = _read_snapshot(snapshot_path, source_key[1:]) if use_snapshot else None
+    if lookups is None:
+        lookups = _parse_lecturer_database(file_path)
+        if not lookups[0]:
+            return lookups # Do not cache a failed load
+        if use_snapshot:
+            _write_snapshot(snapshot_path, source_key[1:], *lookups)
+
+    # Drop entries for older versions of the same file before caching the new one
+    for key in [k for k in _database_cache if k[0] == source_key[0]]:
+        del _database_cache[key]
+    _database_cache[source_key] = lookups
+    return lookups
+
+
+def _merge_learned_aliases(lookups, alias_store_path):
+    """
+    Returns `lookups` with the learned aliases added to alias_to_official. The merged
+    pair is reused until either the base lookups or the alias store change.
+    """
+    global _merged_cache
+    official_name_to_info, alias_to_official = lookups
+    try:
+        stat = os.stat(alias_store_path)
+    except OSError:
+        return lookups # No resolutions recorded yet
+
+    store_key = (os.path.abspath(alias_store_path), stat.st_mtime_ns, stat.st_size)
+    base, cached_key, merged = _merged_cache
+    if base is alias_to_official and cached_key == store_key:
+        return merged
+
+    merged_aliases = dict(alias_to_official)
+    for alias_key, official_name in load_aliases(alias_store_path).items():
+        # Ignore resolutions to lecturers no longer in the database
+        if official_name.lower() in official_name_to_info:
+            merged_aliases[alias_key] = official_name
+
+    merged = (official_name_to_info, merged_aliases)
+    _merged_cache = (alias_to_official, store_key, merged)
+    return merged
+
+def lecturer_database_version(official_name_to_info, alias_to_official):
+    """
+    Returns a short fingerprint of the lookup dictionaries. It changes whenever a
+    lecturer, affiliation or alias changes, and is computed once per loaded version.
+    """
+    global _version_cache
+    source, version = _version_cache
+    if source is not alias_to_official:
+        digest = hashlib.sha1()
+        for key in sorted(official_name_to_info):
+            info = official_name_to_info[key]
+            digest.update(f"{key}\t{info['Department']}\t{info['School']}\n".encode("utf-8"))
+        for alias in sorted(alias_to_official):
+            digest.update(f"{alias}\t{alias_to_official[alias]}\n".encode("utf-8"))
+        version = f"lecturers-{digest.hexdigest()[:12]}"
+        _version_cache = (alias_to_official, version)
+    return version
+
+
+def is_standardized(df, version):
+    """
+    Tells whether `df` was already standardized against lecturer database `version`,
+    either in this process (DataFrame.attrs) or by the analyzer that produced it
+    (a REGISTRY_VERSION_COLUMN column alongside 'Department' and 'School').
+    """
+    if df.attrs.get(REGISTRY_VERSION_COLUMN) == version:
+        return True
+    if REGISTRY_VERSION_COLUMN not in df.columns or len(df) == 0:
+        return False
+    if 'Department' not in df.columns or 'School' not in df.columns:
+        return False
+    return bool((df[REGISTRY_VERSION_COLUMN] == version).all())
+
+
+def _unmatched_in_standardized(df):
+    """
+    Returns the distinct lecturer names of an already standardized frame that the
+    database did not know: standardization leaves their Department and School blank.
+    """
+    if 'Lecturer Name' not in df.columns:
+        return []
+    blank = np.ones(len(df), dtype=bool)
+    for column in ('Department', 'School'):
+        if column in df.columns:
+            values = df[column]
+            blank &= (values.isna() | (values.astype(str).str.strip() == '')).to_numpy()
+    names = df.loc[blank, 'Lecturer Name']
+    return list(dict.fromkeys(str(name).strip() for name in names))
+
+
 def standardize_lecturer_data(df):
     """
     Standardizes lecturer names, departments, and schools in a DataFrame
     based on a lecturer database. Flags lecturers not found in the database.
+    Frames already standardized against the current database version are
+    returned unchanged (see is_standardized); their lecturers without a
+    department and school are still reported as unmatched.
 
     Args:
         df (pd.DataFrame): The input DataFrame containing raw SRTE data,
@@ -83,6 +288,12 @@ def standardize_lecturer_data(df):
         print("Standardization skipped due to missing or invalid lecturer database.")
         return df, []
 
+    # Nothing to do if the frame was already standardized against this database version
+    version = lecturer_database_version(official_name_to_info, alias_to_official)
+    if is_standardized(df, version):
+        print("Lecturer data already standardized against the current lecturer database.")
+        return df, _unmatched_in_standardized(df)
+
     # Make a copy to avoid modifying the original DataFrame directly
     standardized_df = df.copy()
     unmatched_lecturers = []
@@ -92,44 +303,66 @@ def standardize_lecturer_data(df):
         print("Warning: 'Lecturer Name' column not found in the input DataFrame. Skipping lecturer standardization.")
         return standardized_df, []
 
-    # Iterate through each row to standardize lecturer name and populate department/school
-    for index, row in standardized_df.iterrows():
-        raw_name = str(row['Lecturer Name']).strip()
-        lower_raw_name = raw_name.lower()
-        
-        standardized_name = alias_to_official.get(lower_raw_name)
+    # Name variants such as "Dr. Ishola Akintoye" or "Akintoye I." that miss the
+    # exact alias lookup are resolved by their order-insensitive signature.
+    signature_index = get_signature_index(alias_to_official)
+
+    # Resolve each distinct raw name once, then broadcast the results back to
+    # every row. NaN is kept as its own value so it is reported like before.
+    codes, raw_values = pd.factorize(standardized_df['Lecturer Name'], use_na_sentinel=False)
+
+    names = np.empty(len(raw_values), dtype=object)
+    departments = np.empty(len(raw_values), dtype=object)
+    schools = np.empty(len(raw_values), dtype=object)
+
+    for i, raw_value in enumerate(raw_values):
+        raw_name = str(raw_value).strip()
+        standardized_name = alias_to_official.get(raw_name.lower())
+        if not standardized_name and pd.notna(raw_value):
+            standardized_name = signature_index.get(name_signature(raw_name))
 
         if standardized_name:
-            # Found a match, update name and get official department/school
-            standardized_df.at[index, 'Lecturer Name'] = standardized_name
-            
-            # Lookup department and school using the lowercase official name
-            info = official_name_to_info.get(standardized_name.lower())
-            if info:
-                # Update 'Department' and 'School' columns based on the database
-                standardized_df.at[index, 'Department'] = info.get('Department', '')
-                standardized_df.at[index, 'School'] = info.get('School', '')
-            else:
-                # Fallback if somehow the standardized name isn't in info lookup (shouldn't happen with correct building)
-                standardized_df.at[index, 'Department'] = ''
-                standardized_df.at[index, 'School'] = ''
+            # Found a match, use the official name and its department/school
+            names[i] = standardized_name
+            info = official_name_to_info.get(standardized_name.lower(), {})
+            departments[i] = info.get('Department', '')
+            schools[i] = info.get('School', '')
         else:
-            # No match found, flag this lecturer
+            # No match found: keep the raw name, blank the affiliation and flag it
+            names[i] = raw_value
+            departments[i] = ''
+            schools[i] = ''
             unmatched_lecturers.append(raw_name)
-            # You might want to decide what to do with the 'Lecturer Name' in this case:
-            # - Keep the raw name (as it is currently done by default if not overwritten)
-            # - Prepend a flag: standardized_df.at[index, 'Lecturer Name'] = "UNMATCHED: " + raw_name
-            # - Set to a generic placeholder
-            
-            # For unmatched lecturers, set Department and School to empty strings
-            standardized_df.at[index, 'Department'] = ''
-            standardized_df.at[index, 'School'] = ''
-
-    # Remove duplicates from the unmatched list
-    unmatched_lecturers = list(set(unmatched_lecturers))
+
+    standardized_df['Lecturer Name'] = names.take(codes)
+    standardized_df['Department'] = departments.take(codes)
+    standardized_df['School'] = schools.take(codes)
+    standardized_df.attrs[REGISTRY_VERSION_COLUMN] = version
+
+    # Remove duplicates from the unmatched list (distinct raw values can strip to the same name)
+    unmatched_lecturers = list(dict.fromkeys(unmatched_lecturers))
 
     return standardized_df, unmatched_lecturers
 
+def suggest_lecturer_matches(raw_names, k=3):
+    """
+    Proposes lecturer database matches for names the exact alias lookup missed,
+    using a trigram index over every official name and alias.
+
+    Args:
+        raw_names (list): Unmatched raw lecturer names, e.g. from standardize_lecturer_data.
+        k (int): Maximum number of candidates per name.
+
+    Returns:
+        dict: Raw name -> list of (official_name, score) tuples, best first.
+    """
+    _, alias_to_official = load_lecturer_database()
+    if not alias_to_official:
+        return {}
+
+    index = get_trigram_index(alias_to_official)
+    return {name: index.search(name, k=k) for name in raw_names}
+
 if __name__ == '__main__':
     # --- Example Usage (for testing data_standardizer.py directly) ---
     print("Running data_standardizer.py in standalone test mode...")
@@ -1,4394 +1,154 @@
-lecturer_data = [
-    {
-        "Official Name": "AKINTOYE, Ishola",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OWOLABI, Sunday A",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SALAWU, Rafiu",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ASAOLU, Taiwo O.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGBIE,Folajimi F",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DADA, Olajide S.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAOBIA, Apollos",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAOYE, Samuel A.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SIYANBOLA, Trimisiu T",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUNLADE, Olajire A.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALAO, Monisola E.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNDAJO, Grace",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBADE,Ayodeji",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KWARBAI, Jerry",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLURIN, Toyosi",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAYINKA, Ifayemi",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALU, Chituru N.",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI-OWOEYE, Ayooluwa",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OWOLABI, Babatunde",
-        "Department": "Accounting",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OWUALAH Sunday I.",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINTOLA, Abolade",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALALADE, Samson Y.",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBOI, Charles",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBEBOR, Peter I",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANDE, Folorunso",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNDIPE, Samson A.",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANDE Omowunmi",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOSEBI, Tolulope R",
-        "Department": "Finance",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EGWAKHE, Johnson A",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUYOYE, Oluseyi",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BINUYO, Adekunle",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "CHIMA George U.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEFULU, Adesoga D.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KABUOH, Margret",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EGBUTA, Olive U.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONU, Christopher A.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKPA, Victoria",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EGWUONWU, Thomas K.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOETAN, Timothy",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAGAJI, Nanle",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIKE, Emmanuel",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYENI, David",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAKINDE, Olabisi G.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINLABI, Babatunde",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWANKWERE, Idowu A.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BAMIDELE, Ayodeji G.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNDIWIN, Ijeoma",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABATOPE, Valerie",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKEOWO, Florence O.",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKUNLE, Ibrahim A",
-        "Department": "Business Administration",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Clara C",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALEGBELEYE, Gabriel",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "HALISO, Yacob L.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UNEGBU, Vincent E.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABALOLA, Yemisi T.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IKONNE, Chinyere N",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MADUKOMA,Ezinwayi",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOYEMI, Opeyemi",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OWOLABI, Ruth O",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Obinna J",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABOLARIN, Mobolude",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOFOWORA, Omobola G.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Clara C.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBUIYI, Susan U",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONOYEYAN, Glory",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BAMIDELE, Itunu",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EHIOGHAE, Maria",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UKANGWA, Chinemerem C",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FAGBE, Abimbola",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIKE, Chidinma F.",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EVANS-OTUZA, Chidiebere",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALLISON, Goodluck O",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKPARA, Hannah",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESINA, Odunola",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UMAHI, Felicia",
-        "Department": "Information Resources Management",
-        "School": "School of Management Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "PHILLIP, Biola",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TELLA Sheriffdeen A.",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBOLA Joseph Olusegun",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONAKOYA, Adegbemi",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OBIAKOR, Rowland T.",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKWU, Andy Titus",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWALAIYE, Olusola B",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEDELE, Ovikuomagbe A",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWORINDE, Olalekan B.",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWOLAJA, Oladapo Gbenga",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "LAWAL, Esther O.",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BINUYO, Babatunde",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EDY-EWOH, Uduakobong",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANREWAJU, Gideon",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EBERE, Chidinma E.",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSUNDINA, Olawunmi",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AROYEWUN, Bolaji",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKEDINA, Iyabo",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MUSA, Dasauki C",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESUYI, Oluwabukola",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ETOKAKPAN, Mfonobong",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "YUSUFF, Olusola M",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELAKIN, Adejumoke",
-        "Department": "Economics",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJILORE, Kolade",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJOMO, Olusegun",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKERE, Samuel",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOYA, Odunola  Helen",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANATSUI, Clementina",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINTAYO, Babafemi Johnson",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAEGBU, Oguchi O.",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ERNEST-ONUIRI, Patricia E.",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JEGEDE, Omolayo",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOLO-ANAETO, Margaret",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKOJA, Mofoluke",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNWEMIMO, Oluwafisayo O",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ATAKITI, Ifeoluwa O",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SODEINDE, Oluwaseyi A.",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLOMOJOBI, Oluwafemi T.",
-        "Department": "Mass Communication",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAKINDE, James .A.K.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONI, Michael A.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "YACOB-HALISO, Olajumoke",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALAO, David O.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AINA, Ayandiji  D.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AUDU, Sunday D.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NTIWUNKA, Gift U.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOGWUGWU, Ngozi",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNDIWIN, Aaron",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJO, Olawole",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYOMOLA, Oluranti O",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWUMI, Eyitayo F",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWACHUKWU, Joel N.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESIYAN, Victor T",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ISOLA, Abidemi A.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAODIKE Chibuzor",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSAH, Goodnews",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSUNDINA, Olasunkanmi",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGU, Michael I.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "METONOU, Akissi",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALAO, Bukola A",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZE-MICHAEL, Ezedikachi",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYELUDE, Olufunmilayo O.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IKECHI-EKPENDU, Chioma Victoria*",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UNEGBU, Chigozie Pearl",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOIGBERALE, Omonye",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABAJIDE, Jacob F.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OPAKUNBI, Oyedamade T",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ETI, Chinedu E.",
-        "Department": "Political Science and Public Administration",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZEOKOLI, Rita N",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOZUSI, Mercy",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAKINDE, Christiana O.B",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BANJO, Oluwafikayomi",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGBITE, Olanrewaju",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AZORONDU, Abigail",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYANJU Tinuade J.",
-        "Department": "Social Work",
-        "School": "Veronica Adeleke School of Social Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWANGBURUKA, Cyril C",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO, Grace O.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABDULLAH, Abdur-Rahman R",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALUFOHAI, Grace O.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFOLAMI, Carolyn",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEKALE, Kehinde",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUMIDE, Martha D",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABALOLA, Daniel A",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BALOGUN, Olubunmi",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLARINMOYE, Ayodeji O",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSUNTADE, Olubukola",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYO-BELLO, Taofeek A.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SHOBO, Bolatito A",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFODU, Osagie",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINWOLE, Oladele",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NDUBUISI-OGBONNA, Lois C",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINBOYE, Olufunso E",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINTUNDE, Adeyinka O.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BALOGUN James A.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOKOCHA, Amarachi G",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABALOLA, Oluwasegun D",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWOLE, Samuel A.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FILADE Olaoluwa A.",
-        "Department": "Agriculture and Industrial Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELODUN, Joseph F.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNWENMO, Kayode O",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "CHUKWUMA, Victor",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEWOLE, Isaac",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADIO Adesina K",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUTAYO, Foluke",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KANU, Richmond",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BANKOLE, Oluwatosin E",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANOKWURU, Chinedu P.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYINDE, Semiu A.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KEHINDE, Olusegun",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNNOWO, Ayodele A.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWUMI, Aderiike",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BAMISILE, Olabode O",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IDIKA, Digbo",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JEGEDE, David",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADARAMOLA, Feyisara B.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYANLOWO Emmanuel A.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGUNBIADE Samson A.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANBI, Babatunde",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWE, Olufisayo",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONITAYO, Faith",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAJIDE, Adeyemi",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBO Kelvin",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SHOKUNBI, Oluwatosin",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINDADELO Adedeji T.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGUNBIADE Gbenga S.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANIMASHAUN Rufus O.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UKA Uchenna A.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABIOYE, Oyeleye O.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOLA, Leah B.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADARAMOLA, Feyisara B.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWADIKE, Ugochi F.",
-        "Department": "Basic Sciences",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JONATHAN, Segun G",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAJUYIGBE, Olufunmiso O.",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZEKIEL, Chibundu N.",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AINA, Ayandiran D",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBAYO Elijah A.",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZEAMAGU, Cajethan O",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOYE-ISIJOLA,Morenike O",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MENSAH-AGYEI, Grace O.",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSOPALE, Babasola",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEDELE, Oluwawapelumi",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYENI, Kolawole",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONUMAEGBU, Chinweizu",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETILORO, Esther O",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEWOLE,Temitope",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWOYINKA, Iyabo R.",
-        "Department": "Microbiology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWODELE Oludele",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKUNLE, Adeyinka A",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKOLIE, Samuel O.",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBONNA, Chibueze A.",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOTOSHO, Olawale J",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZE, Monday",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBAJE Olugbenga M.",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KUYORO, Afolashade",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYANKOYA, Folasade Y",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGBENJO,Aderonke",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONUIRI, Ernest",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANDE, Oyebola",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Adebowale O.",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EBIESUWA, Oluwaseun",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Ukonu R",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESEGUN, Oreoluwa",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Oluwabukola",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMANZE, Ruth",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABEL, Samuel",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOMEFUN, Olawale M.",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKPA,Ogbonnaya",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NZENWATA, Uchenna J",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OHWO Onome",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMUSA, Afolarin I",
-        "Department": "Computer Science",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IDOWU, Sunday A.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JOSHUA, Jonah",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAITANMI, Olusola",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOLA, Olubukola",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Sunday Wumi",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETUNJI,Oluwatofunmi",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADIGUN Taiwo O.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MENSAH, Yaw",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYENUGA, Ebenezer",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EHIOGHAE, Eseosa E.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGBOLA Adesoji A.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OTUNEME Nzechukwu C.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWONIYI Amos T.",
-        "Department": "Software Engineering",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBAYO, Adewale  O.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALAO Olujimi D.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNLERE, Samson O.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAEGBU, Chigozirim",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOTUNDE, Ayokunle A.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGU, Emmanuel C",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IZANG, Aaron A.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFONNE, Emmanuel I.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONILEDE, Olutimilehin M.",
-        "Department": "Information Technology",
-        "School": "School of Science and Technology",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOSU, Constance C.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO, Ademola Stephen",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNJI, James A.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADERANTI, Ruth A.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOSU, Jonathan",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "WIILIAMS, Taiwo M.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOYE, Ayodele",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UWANNAH, Ngozi C.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYODELE, Kolawole",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMANZE, Samuel",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FILADE, Bankole",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALADE, Feyisayo O",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "PETER Louis A.",
-        "Department": "Education",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOLEWA, Michael  A",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESEGUN, Abiodun",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EKANADE Olumide",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "POPOOLA, Michael A.",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UGWUKAH, Alexander",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EREGARE, Emmanuel",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYANLOWO, Oluwatosin B.",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKPUH,Charles C",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELEKE, Odunayo D",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWACHUKWU, Chituru",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWADARA, Ebunoluwa D.",
-        "Department": "History and International Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOTUNSA, Mobolanle E.",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KEHINDE, Ayobami",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IDOWU, Olubunmi A.",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IGUANRE, Solomon",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLU-OSAYOMI, Olusegun",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AINA Mary O.",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABOLUWARIN, Simon A.",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBUA, Babatunde",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADAM, Ezinwanyi",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKATA,Gift",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADISA, Akinkorede",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IKUELOGBON, Kehinde",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KPAROU, Hanoukoume",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OCHULOR,Nwaugo G.",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLASEHINDE, Felicia",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KALEJAIYE, Abiola",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MURITALA, Shuaib A",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEWOLE, Queen",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLADIIPO, Olawale J",
-        "Department": "Languages and Literary Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLATUNJI, Michael O",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJUOLA, B. Olusegun",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKPARA, Mabel U.",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DARAMOLA, Tolulope O",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DENNIS, Amarachukwu",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYINKA, Olufemi E.",
-        "Department": "Music and Creative Arts",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMANZE, Philemon",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETUNJI, Adelowo",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKPA, Michael O.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANREWAJU, Joseph A",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EHIOGHAE, Efe M.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOSU Rowland",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EKPENDU Ikechi/HOD",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DICKSON, Theodore",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAOMAH, Evans",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABALOLA, James A.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ZOAKA, Joshua J.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABOLARIN, Isaiah O",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MASFA, Gabriel",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINPELU, Oluseun A.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYINLOYE Muyiwa A.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IKHANE, Harriet",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLADOSU, Opeyemi T",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "CHARLES, Emmanuel",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESANYA, Adebowale",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NGO IKUOBA, Samuelle",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAKA, Ejii Promisen",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOTI, John",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWUMI, Elijah K",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABARIBE, Chukwuemeka",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IMAM, Yetunde A.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DANIEL, Dauda G",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ECHIGBUE, Lucky .O",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLA, David",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABOLARIN, Kehinde",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AZORONDU, Peter",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLADINI, Olabode O.",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFANGA, Terseer S",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJUZIE, Goodluck C",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BIAGUE, Laguibilssial",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKAN-GBENEDIO Gift O",
-        "Department": "Religious Studies",
-        "School": "School of Education and Humanities",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADERIBIGBE, Titilayo O",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLOMOJOBI,Yinka",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADAM, Eteete M.",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABANGWU, Nzeribe E.",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EMEJURU, Adielechi O.",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "APAMPA, Oluseyi",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JAMES, Louisa D.",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUFEMI, Omobamidele O.",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UZUEGBU-WILSON, Emmanuel",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKONKOH, Amarachi*",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABIODUN-ONI, Taiwo",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBAYO, Josephine",
-        "Department": "International Law and Security Studies",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBEDE, Isaac O.",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AROWOLO, Ayoyemi O",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONYEMELUKWE-ONUOBIA, Cheluchi",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IMOSEMI, Adekunbi F.",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAIWO, Adetayo A.",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUGASA, Olubukola A.",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYEMI, Ajani B.",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYAGIRI, Buduka",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EMMANUEL, Chinaka",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AARON Promise N",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAKINDE Adesewa",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO Oluwatofunmi",
-        "Department": "Jurisprudence and Public Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SODIPO, Bankole A.",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANREWAJU, Pius O.",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLIYIDE, Olusesan",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUNAIKE, Dorcas A.",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BELLO, Adesina",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EKUNDAYO, Veronica N.",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBAYO, Adesoji",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBADE, Toluwalase",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANDE, Bolatito",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IKONNE Deborah",
-        "Department": "Private and Commercial Law",
-        "School": "School of Law and Security Studies",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DESALU, Ayodele B.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Iheanyichukwu O.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNNAIKE, Philip",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYANNUGA, Olugbenga A",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IMOSEMI, Innocent O.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BEJIDE, Ronald",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUKOYA Samson",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWATOSIN, Adesina",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLATUNJI, Sunday Y",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANREWAJU, John A",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELODUN, Stephen Taiye",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FABIYI, Oluseyi",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABIJO Ayodeji",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETUNJI, Opeyemi Adebola",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNBIYI, Olubunmi E.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELAKIN, Lola",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBOYE, Olaolu J.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADENIJI, Kehinde O.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBADE, Testimony P.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JOSHUA Naomi",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGBOLA Goodness",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SAMBO, Jacob A.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OBAOYE, Afoluwajuwonlo G.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAYINKA Olugbenga",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DAVID Beaulah",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FRIDAY, Kingsley C.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NGOZI, Bright. A.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOBOWALE, Folorunsho",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MORRIS, B. Freeman",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFOLAYAN, Sunday O.",
-        "Department": "Anatomy",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBAWO, Olugbenga",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONAJOBI, Funmilayo D.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANYASOR, God'swill N.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSONIYI, Omolaja",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKANDE, Idowu S",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SHOKUNBI, Olutayo S.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UGBAJA, Regina",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KAYODE, Abolanle A",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ESIABA, Ijeoma",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKODUWA Stanley I.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMAH, Gogonte",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINPELU Akintunde",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETAYO, Modupe",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNBIYI, Babafemi T",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETUNJI, Oluwaseyi",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINNAWO, Omowumi O.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAJIDE, Laide O.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBONNAYA Faith C.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UKANGWA Ngozi",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWOLE, Oluwaseun",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYINDE,Adebara J.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ORODELE, Kunle",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NTIWUNKA, Glory C.",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IBRAHEEM-MARTINS, Adijat",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "Ogunsanwo Oluwatosin",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ACHOR Cornilius, Bangsi",
-        "Department": "Biochemistry",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYEYE, Joshua A.",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOYE, Bolade K.",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANI, Ime",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NGOZI, Elizabeth",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINLADE, Ademola R",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJUZIE, Nnenna C.",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALFA, Tirza",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FALADE, Caroline K.",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINKUNMI Taiwo",
-        "Department": "Nutrition and Dietetics",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEGOKE Olufeyisipe A.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONASANWO, Samuel A.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWOBAJO, Funmileyi O.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBOYE, Kolawole I.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLOYO Ahmed K.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINDELE, Raheem",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNSOLA, Oluseyi A.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NABOFA, Egide W",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGHENETEGA, Onome B",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALABI, Great O.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOYE, Ayodeji",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MOFOLORUNSO Adekunle M.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEBANJO Oyetola",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BADEJOGBIN, Olabimpe C.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKWUTE, Patrick G.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOBANDE, Elizabeth M.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEOTI, Isiaka A",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEWUMI, Samson O",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKANI, Hope U.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSUNDINA Olawumi O.",
-        "Department": "Physiology",
-        "School": "School of Basic Medical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABBIYESUKU, Fayeofori M",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KUTI, Modupe A.",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOBI,Nnenna L",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOYINKA,Oluwatosin O",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BAMIDELE, Olabisi Titilayo",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLATUNDE, Olayanju",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KING,Roseline",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEWOLE, Omolara",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLASEHINDE, Olanrewaju",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAKA, Benjamin Eson",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "LADIPO, Oluwakemi",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKONKWO, Ngozi Esther",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NGOZI, Joseph Nwawenen",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JOSEPH, Victoria Onyinye",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NNADOZIE, Nkemijika Success",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINDULURENI, Oluwaseun",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLASEINDE, Omobolanle O",
-        "Department": "Chemical Pathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEDIRAN, Adewuni",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANIYI, John A.",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "WAKAMA Tamunomieibi",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYELESE, Adesola",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYEMO, Oluwatosin",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWODELE, Ibironke Oluwaseun",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MBAH, Chimezie S.",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEYEMI, Adebayo Adebowale",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADARAMOLA, Mary Funmibi",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKAFOR, Uchenna (Nnamah)",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BOYEDE, Olusola Temidayo",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FAYIGA, O. Ayodele",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETOSOYE, Adewale",
-        "Department": "Haematology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ELIKWU, Charles John",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKANGBA, Chika C",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SHONEKAN, Opeoluwa A",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWADIKE, Victor",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OTAIGBE, Idemudia I",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWOLE, Temitayo O",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO, Babatunde",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKEREDOLU, Abosede Abolanle",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMEONU, Azubuike Chidiebere",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FALUYI, Bibitayo",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BELLO, Saheed Oluwabamise",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EBEIGBE Ejime",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSINOWO, Adeniyi",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EKPUDA, Sydney I.",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNBIYI, Adenike Itunu",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SADARE, Oluwadamilola Aminat",
-        "Department": "Medical Microbiology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MANDONG, Barnabas",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOLAJA, Taiwo",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADENIRAN, Anthony A.",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Olalekan Abisola",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWADIOKU, John I.",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKEBALAMA, Victor Chimezie",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAWALE, Tolulope John",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBOOLA, Olusegun",
-        "Department": "Histopathology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "WALKER, Oladapo",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWODELE, Olufunsho",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINYEDE, Akinwumi A",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FUNWEI, Roland D.",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNJIMI, Luqman",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UYUIABASI, Gabriel",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNDARE,Temitope",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OBIANUO, Chineta S",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGADA,Omowunmi",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAEGBU, Victoria Udo",
-        "Department": "Pharmacology",
-        "School": "School of Basic Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALAUSA,Olanipekun K",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABIODUN, Olumide A",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ASHIPA, Temitope",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SHODEINDE, Kolawole",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BAMIDELE, Emmanuel Fikayo",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMAIKE, Chikwendu",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSINAIKE, Abiodun",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEFALA, Ngozi",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OMOTOSHO, Yejide Adebola",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNYEMI, Kehinde Olawale",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODIARI, A. Onyeunoneme",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESUYI, Ayobami Okanlanwun",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINBOLA, Akinyemi",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLARINMOYE, Ngozi E.",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWANKWO, Nkechinyere",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JOHN, Chinenye Blessing",
-        "Department": "Community Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "WALKER, Oladapo",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JEMILOHUN, Christopher",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OPREY, Oweigbo P",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IDOWU, Akolade O",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "LADELE, Akindele E",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNKOYA, John. O.",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FASESAN, Oluwatoyin",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IMISHUE, Onome T",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UDUAGBAMEN, Peter K",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOYINKA, Folashade",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AFOLABI, David O.",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWOKOYA, Eunice",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSIBOWALE, Bamikole Tosin",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UKA, Aaron ThankGod",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NGUBOR, Taamaka D.",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOGBE, Igwebuike",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EIGBE, Olubunmi Solomon",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNMOLA, Marion Itohan",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANI, Francis Chikezie",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESUYI, Yetunde Oluwatosin",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BOCO, N. Opeoluwa",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNLADE, F. Akinwale",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BINUYO, Tolulope O",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EMERUWA, George",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UNUAYEFE, E. Obaro",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNJIMI, O. Luqman",
-        "Department": "Internal Medicine",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANI, Franklin I",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOTUNSA, John O",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IMARALU, John O",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLALEYE, Atinuke",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKADRI, Adebayo",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "GRILLO, Elizabeth Oluwakemi",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWANKPA, Chimaobi Chukwuemeka",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELOWO, Olumuyiwa Olalekan",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUGBEMI, Odutola",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ATUNRASE-SOTOLA, Remilekun",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLALEYE Deborah Bukunmi",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABILOMU, Augustina",
-        "Department": "Obstetrics and Gynaecology",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "RENNER, James K",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNLESI, Tinuade",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOYA, Adesola",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABOLURIN, Olufunmilola",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYENI, Victor",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOKUNBI, Ogochukwu",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Fisayo",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIBOLA, Emmanuel",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONI, Taiwo",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJO, Aniebiet",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZIGBO, Chinwendu",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELODUN, Oladunmade",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BITTO, Msoo",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "UGOCHUKWU, Christian",
-        "Department": "Paediatrics",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Iheayichukwu O.",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONUOHA, Clement",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AWEDA, Moses",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEDELE, Titus A",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "YUSUF, Abdallah A",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JAGUN, Omodele O",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADETAYO, Adekunle",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINOLA, Moses A",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SALAMI, Omotayo",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MORGAN, Eghosa",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINDIPE, Jabez A",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNTADE, Florence A O",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BETIKU, Anthony O",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONUOHA, Kelechukwu C",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "THOMPSON, Mary Umoh",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUSOGA-PETERS, Oluwapelumi",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "APATA, Kehinde Omotola",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ELEMILE, O. Peter",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJELABI, Sunday Ojewale",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EFFIONG, Asuquo Prince",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AYENI, Akinwunmi Ayodeji",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEFEMISOYE ,A. Gbadega",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODEJAYI, I. Segun",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BABALOLA, Ayodeji Emmanuel",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKAH, K. Queen",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NJOKU, A. Chidi",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OWOLABI, Ife Johnson",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IDEM, I Blessing",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OBONG, Udemeobong",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABUGU, Ogechukwu Crescent",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGBU-OFOHA H. Nnamdi",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ISICHEI, C. Chukwuemeka",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAERO, Goodness",
-        "Department": "Surgery",
-        "School": "School of Clinical Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJEWOLE Foluso",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSUNDINA, Ezekiel O.",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "LAWAL Clara O.",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EZEKIEL-YOUNG Ugochi",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "WENNIE, Jumai S",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADERETI, Stella C.",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWAOMAH, Esther",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWOZICHI, Chinomso",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OPE-BABADELE, Oluwatosin",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSONUGA, Adewoyin",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEBIYI, Joseph A.",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ASONYE Christian C.",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "GIGI, Marvellous",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALABI, Adebukunola",
-        "Department": "Adult Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAO, Ezekiel O.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TIJANI, Adelani",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "KIO, Janet O.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKAFOR, Ngozi A.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODEWUSI, Temitayo A.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MAITANMI, Julius O.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "LESLIE, Tabitha A.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNGBESAN, Joshua O.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ABARIBE Chidinma E.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLU-ABIODUN Oluwatosin O.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IBITOYE, Florence B",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINMOLAYAN, Marcelina M.I.",
-        "Department": "Community Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOWUNMI, Christiana O",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONASOGA, Olayinka A.",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOLANKE, Adesola A",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANOKWURU, Rafiat A.",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJO, Eunice Abimbola",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBONJINMI, Lawrence",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKWUIKPO, Margaret I",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNFOWOKAN, Oluwatosin Y",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO, Folasade O",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOYA, Lydia A.",
-        "Department": "Maternal and Child Health",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOWUNMI, Christiana O",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONASOGA, Olayinka A.",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SOLANKE, Adesola A",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ANOKWURU, Rafiat A.",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OJO, Eunice Abimbola",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBONJINMI, Lawrence",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKWUIKPO, Margaret I",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNFOWOKAN, Oluwatosin Y",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "TAYO, Folasade O",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEKOYA, Lydia A.",
-        "Department": "Mental Health and Psychiatry",
-        "School": "School of Nursing Sciences",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "IHONGBE, John Cletus",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AVWIORO,  Godwin",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINLOYE, Oluyemi",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJAYI, Olutayo",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALLI, Oyebode A.T.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEJUMO, Esther Ngozi",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OFEM Oluchi Gladys",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ENITAN, Seyi  Samson",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESINA, Opeyemi Olufeyisola",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADEDIJI, Isaac  O.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "BANKOLE, Julius",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ONYEGBULA, Kenneth",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ILEOMA, Emmanuel  O.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADELAKUN. Ayodele",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWALOYE Gideon Taiwo",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OSAKUE, Eguagie O.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUSANYA, Temitope Oyewole",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "FAKOYA, Olatunde O.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "EFFIONG, Effiong Joseph",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUWAKEMI, Ladipo",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKOROCHI, Chinenye",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUREMI, S. Adeola",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OKORO, Chigozie Victor",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JOSHUA, Bitrus A.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "JAMES Chibueze O.",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADESUYI, Bola Victoria",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "CHIMA, Esther",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADENUGA Ile-Ola Benita",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "MICHAEL Blessing Nneka",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYEFUGA, O. Helen",
-        "Department": "Medical Laboratory Science",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINBOYE, Dora O.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ATULOMAH, Nnodimele O. S.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AMOSU, Ademola M",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AKINSOLA, Henry A.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ADENIRAN, Ezekiel A.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLANREWAJU, Motunrayo",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AGBEDE, Catherine",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ALEMU,Wondimagegnehu",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "NWARU, Bright",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLUGASA, Babasola O.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OYERINDE, Oyewole O.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OLAOYE,Titilayo",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "AJIKE, Saratu",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ASEKUN-OLARINMOYE, Ifeoluwapo",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "OGUNSANMI, Ololade",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "DANGANA, Jonathan",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ORITOGUN, Kolawole",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "PANUEL-EGWAKHE, Clarita",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "CHINENYE-JULIUS, Augusta E",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "ODUYOYE, Omobola",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "POPOOLA, Comfort O.",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    },
-    {
-        "Official Name": "SAJOBI, Titus",
-        "Department": "Public Health",
-        "School": "School of Public and Allied Health",
-        "Aliases": ""
-    }
-]
+import os
+
+import numpy as np
+
+# Compact lecturer registry produced by extract_lecturer_data.py. Names are stored once
+# per lecturer; departments and schools are interned string tables referenced by
+# integer codes, and aliases point at their lecturer's row.
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lecturer_registry.npz")
+
+
+class LecturerRegistry:
+    """
+    Columnar, read-only view of the lecturer registry.
+
+    Lookups are case-insensitive and follow the same rules as
+    data_standardizer.load_lecturer_database: official names are their own alias,
+    and later rows win when two rows share a name or alias.
+    """
+
+    def __init__(self, names, department_codes, departments, school_codes, schools,
+                 aliases, alias_rows):
+        self.names = names
+        self.department_codes = department_codes
+        self.departments = departments
+        self.school_codes = school_codes
+        self.schools = schools
+        self.aliases = aliases
+        self.alias_rows = alias_rows
+        self._lookup_dicts = None
+
+        # Lowercase official name / alias -> row
+        self._name_index = {name.lower(): row for row, name in enumerate(names.tolist())}
+        self._alias_index = dict(self._name_index)
+        for alias, row in zip(aliases.tolist(), alias_rows.tolist()):
+            self._alias_index[alias.lower()] = row
+
+    def __len__(self):
+        return len(self.names)
+
+    def official_name(self, name):
+        """Returns the official name for an official name or alias, or None if unknown."""
+        row = self._alias_index.get(str(name).strip().lower())
+        return None if row is None else str(self.names[row])
+
+    def lecturer_info(self, official_name):
+        """Returns {'Department': ..., 'School': ...} for an official name, or None if unknown."""
+        row = self._name_index.get(str(official_name).strip().lower())
+        if row is None:
+            return None
+        return {
+            'Department': str(self.departments[self.department_codes[row]]),
+            'School': str(self.schools[self.school_codes[row]]),
+        }
+
+    def lookup_dicts(self):
+        """
+        Returns the registry as the (official_name_to_info, alias_to_official) pair
+        produced by data_standardizer.load_lecturer_database.
+        """
+        if self._lookup_dicts is None:
+            official_name_to_info = {
+                key: self.lecturer_info(self.names[row]) for key, row in self._name_index.items()
+            }
+            alias_to_official = {key: str(self.names[row]) for key, row in self._alias_index.items()}
+            self._lookup_dicts = (official_name_to_info, alias_to_official)
+        return self._lookup_dicts
+
+    def records(self):
+        """Returns the registry as a list of lecturer dicts, in the original row order."""
+        aliases_by_row = {}
+        for alias, row in zip(self.aliases.tolist(), self.alias_rows.tolist()):
+            aliases_by_row.setdefault(row, []).append(alias)
+        return [
+            {
+                'Official Name': name,
+                'Department': str(self.departments[self.department_codes[row]]),
+                'School': str(self.schools[self.school_codes[row]]),
+                'Aliases': ', '.join(aliases_by_row.get(row, [])),
+            }
+            for row, name in enumerate(self.names.tolist())
+        ]
+
+
+# Absolute file path -> LecturerRegistry, loaded on first use
+_registries = {}
+
+
+def get_registry(file_path=REGISTRY_FILE):
+    """Loads the lecturer registry at `file_path` on first use and returns the shared instance."""
+    path = os.path.abspath(file_path)
+    registry = _registries.get(path)
+    if registry is None:
+        with np.load(path, allow_pickle=False) as data:
+            registry = LecturerRegistry(
+                data['names'], data['department_codes'], data['departments'],
+                data['school_codes'], data['schools'], data['aliases'], data['alias_rows'],
+            )
+        _registries[path] = registry
+    return registry
+
+
+def _table_codes(codes, table, label):
+    """Returns the codes into an interned string table as int16."""
+    if len(table) > np.iinfo(np.int16).max + 1:
+        raise ValueError(f"Error: The lecturer registry has {len(table)} {label}; at most "
+                         f"{np.iinfo(np.int16).max + 1} are supported.")
+    return codes.astype(np.int16)
+
+
+def write_registry(lecturer_data, file_path=REGISTRY_FILE):
+    """
+    Writes lecturer records to the compact registry file.
+
+    Args:
+        lecturer_data (list): Dicts with 'Official Name', 'Department', 'School'
+                              and optional comma-separated 'Aliases'.
+        file_path (str): Destination .npz file.
+
+    Raises:
+        ValueError: If there are too many departments or schools to store.
+    """
+    departments, department_codes = np.unique(
+        [entry['Department'] for entry in lecturer_data], return_inverse=True
+    )
+    schools, school_codes = np.unique(
+        [entry['School'] for entry in lecturer_data], return_inverse=True
+    )
+
+    aliases = []
+    alias_rows = []
+    for row, entry in enumerate(lecturer_data):
+        for alias in str(entry.get('Aliases') or '').split(','):
+            if alias.strip():
+                aliases.append(alias.strip())
+                alias_rows.append(row)
+
+    np.savez_compressed(
+        file_path,
+        names=np.array([entry['Official Name'] for entry in lecturer_data], dtype=str),
+        department_codes=_table_codes(department_codes, departments, "departments"),
+        departments=departments,
+        school_codes=_table_codes(school_codes, schools, "schools"),
+        schools=schools,
+        aliases=np.array(aliases, dtype=str),
+        alias_rows=np.array(alias_rows, dtype=np.int32),
+    )
+    _registries.pop(os.path.abspath(file_path), None)  # Reload the new contents on next use
+
+
+def __getattr__(name):
+    # `lecturer_data` used to be a module-level list literal; build it on demand for old callers.
+    if name == "lecturer_data":
+        return get_registry().records()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
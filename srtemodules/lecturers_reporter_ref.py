@@ -1,30 +1,137 @@
 # To add a new cell, type '# %%'
 # To add a new markdown cell, type '# %% [markdown]'
 
+import io
+from concurrent.futures import ProcessPoolExecutor
+from zipfile import ZipFile
+
 import numpy as np
 import pandas as pd
 
 # from fpdf import FPDF
-from srtemodules.srte_report import get_report
+from srtemodules.comments_extractor import build_comment_index
+from srtemodules.srte_report import prepare_report_fonts, render_report
+
+# Lecturer chunks handed to each worker process; more chunks than workers keeps
+# the pool busy when some lecturers have many more courses than others
+CHUNKS_PER_WORKER = 4
+
+# Per-process state set up once by _init_report_worker
+_worker_state = {}
+
+
+def _init_report_worker(comment_index, semester, year):
+    """Runs once in each worker: loads the fonts and keeps the shared batch inputs."""
+    prepare_report_fonts()
+    _worker_state["comment_index"] = comment_index
+    _worker_state["semester"] = semester
+    _worker_state["year"] = year
+
+
+def _report_chunk(student_lists):
+    """Renders the reports of one chunk of lecturers as (file name, PDF bytes) pairs."""
+    return [
+        render_report(
+            student_list, None, _worker_state["semester"], _worker_state["year"],
+            _worker_state["comment_index"],
+        )
+        for student_list in student_lists
+    ]
+
+
+def _generate_parallel(student_lists, comment_index, semester, year, workers):
+    """
+    Spreads the per-lecturer reports over a pool of `workers` processes and returns
+    their (file name, PDF bytes) pairs in the order of `student_lists`.
+    """
+    n_chunks = min(len(student_lists), workers * CHUNKS_PER_WORKER)
+    # Round-robin split, so every chunk gets a similar mix of lecturers
+    chunks = [student_lists[i::n_chunks] for i in range(n_chunks)]
+
+    # Parse the fonts here first, so the workers find the font metric cache ready
+    prepare_report_fonts()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_report_worker,
+        initargs=(comment_index, semester, year),
+    ) as executor:
+        # Iterating the results re-raises any error from a worker
+        reports = [None] * len(student_lists)
+        for i, chunk_reports in enumerate(executor.map(_report_chunk, chunks)):
+            # Put each report back in its lecturer's place in the batch
+            reports[i::n_chunks] = chunk_reports
+    return reports
+
 
+def render_lec_reports(summary, df, semester, year, lecturer=None, workers=1):
+    """
+    Renders one PDF report per lecturer in `summary` (or only for `lecturer`) in memory.
 
-def generate_lec_report(summary, df, semester, year, lecturer=None):
+    Args:
+        summary (pd.DataFrame): Standardized summary data.
+        df (pd.DataFrame): Comment data.
+        semester (str): Semester printed in the report headers.
+        year (str): Academic session printed in the report headers.
+        lecturer (str): Only report on this lecturer, if given.
+        workers (int): With workers > 1, an all-lecturer run is spread over that
+                       many processes. The output is the same whatever the number.
+
+    Returns:
+        dict: PDF file name -> PDF bytes. As when the reports were written to one
+              folder, a later report replaces an earlier one of the same name.
+    """
     if lecturer == None:
         # Create report for all lecturers in a school
+        # Clean and aggregate the comments once for the whole batch
+        comment_index = build_comment_index(df)
         lecturers = summary["Lecturer Name"].unique()
-        for name in lecturers:
-            student_list = summary[summary["Lecturer Name"] == name]
-
-            if len(student_list) > 1:
-                get_report(student_list, df, semester, year)
-            elif len(student_list) == 1:
-                get_report(student_list, df, semester, year)
-    else:
-        # Create report for a single lecturer
-        student_list = summary[summary["Lecturer Name"] == lecturer]
-        # student_list = student_list[student_list['Resp Rate'] >= 70]
-        if len(student_list) > 1:
-            get_report(student_list, df, semester, year)
-        elif len(student_list) == 1:
-            get_report(student_list, df, semester, year)
-    # print("Report generated successfully...")
+        by_lecturer = dict(tuple(summary.groupby("Lecturer Name", sort=False)))
+        student_lists = [by_lecturer[name] for name in lecturers if name in by_lecturer]
+
+        if workers > 1 and len(student_lists) > 1:
+            return dict(_generate_parallel(student_lists, comment_index, semester, year, workers))
+
+        return dict(
+            render_report(student_list, df, semester, year, comment_index)
+            for student_list in student_lists
+        )
+
+    # Create report for a single lecturer
+    student_list = summary[summary["Lecturer Name"] == lecturer]
+    # student_list = student_list[student_list['Resp Rate'] >= 70]
+    if student_list.empty:
+        return {}
+    return dict([render_report(student_list, df, semester, year)])
+
+
+def zip_files(files):
+    """
+    Bundles rendered files into a zip archive built in memory.
+
+    Args:
+        files (dict): File name -> file bytes, e.g. as from render_lec_reports.
+
+    Returns:
+        bytes: The zip archive.
+    """
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def generate_lec_report(summary, df, semester, year, lecturer=None, workers=1):
+    """
+    Writes one PDF report per lecturer in `summary` (or only for `lecturer`) to the
+    current working directory; see render_lec_reports.
+
+    Returns:
+        list: Names of the files written.
+    """
+    reports = render_lec_reports(summary, df, semester, year, lecturer, workers)
+    for name, data in reports.items():
+        with open(name, "wb") as pdf_file:
+            pdf_file.write(data)
+    return list(reports)
@@ -0,0 +1,182 @@
+import re
+
+import numpy as np
+
+# Anything that is not a letter or digit separates name tokens
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_name(name):
+    """Lowercases a name and collapses punctuation and whitespace to single spaces."""
+    return _NON_ALNUM.sub(' ', str(name).lower()).strip()
+
+
+# Honorifics dropped from a name before building its signature
+NAME_TITLES = frozenset({
+    'dr', 'prof', 'professor', 'mr', 'mrs', 'miss', 'ms', 'sir', 'rev', 'revd',
+    'pastor', 'pst', 'elder', 'engr', 'barr', 'arc', 'chief', 'hon', 'dcn', 'deacon',
+})
+
+
+def name_signature(name):
+    """
+    Returns the order-insensitive signature of a name: lowercase, punctuation and
+    titles removed, tokens sorted. 'Dr. Ishola Akintoye' and 'AKINTOYE, Ishola' both
+    give 'akintoye ishola'.
+    """
+    tokens = [t for t in normalize_name(name).split() if t not in NAME_TITLES]
+    return ' '.join(sorted(tokens))
+
+
+def name_signature_variants(name):
+    """
+    Returns the signatures a registry name should answer to, as (signature, priority)
+    pairs; lower priority wins when two lecturers share a signature.
+
+    For 'SURNAME, Given names' entries the given names are also expanded into their
+    initials, so 'OWOLABI, Sunday A' answers to 'Owolabi S. A.', 'Owolabi Sunday' and
+    'Owolabi S.' as well as its full signature.
+    """
+    variants = [(name_signature(name), 0)]
+    if ',' not in name:
+        return variants
+
+    surname, given = name.split(',', 1)
+    surname_tokens = [t for t in normalize_name(surname).split() if t not in NAME_TITLES]
+    given_tokens = [t for t in normalize_name(given).split() if t not in NAME_TITLES]
+    if not surname_tokens or not given_tokens:
+        return variants
+
+    initials = [t[0] for t in given_tokens]
+    for given_form in (initials, given_tokens[:1], initials[:1]):
+        variants.append((' '.join(sorted(surname_tokens + given_form)), 1))
+    return variants
+
+
+def build_signature_index(alias_to_official):
+    """
+    Maps the signature variants of every official name and alias to its official name.
+    Signatures claimed by more than one lecturer at the same priority are dropped, so a
+    probe never picks between two people.
+
+    Args:
+        alias_to_official (dict): Lowercase alias (including official names) -> official name.
+
+    Returns:
+        dict: Signature -> official name.
+    """
+    best = {}  # signature -> (priority, official name or None when ambiguous)
+    for alias, official in alias_to_official.items():
+        for signature, priority in name_signature_variants(alias):
+            if not signature:
+                continue
+            current = best.get(signature)
+            if current is None or priority < current[0]:
+                best[signature] = (priority, official)
+            elif priority == current[0] and current[1] != official:
+                best[signature] = (priority, None)
+
+    return {signature: official for signature, (_, official) in best.items() if official}
+
+
+def name_trigrams(name):
+    """Returns the set of character trigrams of a normalized, space-padded name."""
+    padded = f"  {normalize_name(name)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Character-trigram inverted index over every official name and alias in the
+    lecturer lookup, used to propose matches for names the exact lookup missed.
+
+    A query only touches the posting lists of its own trigrams, so its cost grows with
+    the number of registry names sharing a trigram with it, never with the size of the
+    whole registry times the number of queries.
+    """
+
+    def __init__(self, alias_to_official):
+        """
+        Args:
+            alias_to_official (dict): Lowercase alias (including official names) ->
+                                      official name, as from load_lecturer_database.
+        """
+        self.keys = list(alias_to_official)
+        self.officials = [alias_to_official[key] for key in self.keys]
+
+        postings = {}
+        sizes = np.empty(len(self.keys), dtype=np.int32)
+        for key_id, key in enumerate(self.keys):
+            trigrams = name_trigrams(key)
+            sizes[key_id] = len(trigrams)
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(key_id)
+
+        self.sizes = sizes
+        self.postings = {
+            trigram: np.array(ids, dtype=np.int32) for trigram, ids in postings.items()
+        }
+
+    def search(self, name, k=3, min_score=0.3):
+        """
+        Proposes the best registry matches for `name`.
+
+        Args:
+            name (str): The raw lecturer name to resolve.
+            k (int): Maximum number of distinct official names to return.
+            min_score (float): Minimum Dice similarity (0-1) of a returned candidate.
+
+        Returns:
+            list: (official_name, score) tuples, best first, one per official name.
+        """
+        trigrams = name_trigrams(name)
+        hits = [self.postings[t] for t in trigrams if t in self.postings]
+        if not hits:
+            return []
+
+        # Shared-trigram count for every key that has at least one trigram in common
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.keys))
+        candidates = np.flatnonzero(shared)
+        scores = 2.0 * shared[candidates] / (self.sizes[candidates] + len(trigrams))
+
+        keep = scores >= min_score
+        candidates, scores = candidates[keep], scores[keep]
+        order = np.argsort(-scores, kind='stable')
+
+        matches = []
+        seen = set()
+        for i in order:
+            official = self.officials[candidates[i]]
+            if official in seen:
+                continue
+            seen.add(official)
+            matches.append((official, round(float(scores[i]), 3)))
+            if len(matches) == k:
+                break
+        return matches
+
+
+# (alias_to_official the index was built from, index). The lookup dicts are cached
+# per lecturer database version, so identity tracks the registry version.
+_index_cache = (None, None)
+_signature_cache = (None, None)
+
+
+def get_signature_index(alias_to_official):
+    """Returns the signature index for `alias_to_official`, building it only when it changes."""
+    global _signature_cache
+    source, index = _signature_cache
+    if source is not alias_to_official:
+        index = build_signature_index(alias_to_official)
+        _signature_cache = (alias_to_official, index)
+    return index
+
+
+def get_trigram_index(alias_to_official):
+    """Returns the TrigramIndex for `alias_to_official`, building it only when it changes."""
+    global _index_cache
+    source, index = _index_cache
+    if source is not alias_to_official:
+        index = TrigramIndex(alias_to_official)
+        _index_cache = (alias_to_official, index)
+    return index
@@ -0,0 +1,60 @@
+class PrefixTrie:
+    """
+    Character trie mapping course-code prefixes to a value (e.g. a school name).
+
+    Lookups walk the trie once along the course code and return the value of the
+    longest registered prefix, so overlapping prefixes such as 'ECO'/'ECON' or
+    'COS'/'COSC' always resolve to exactly one value.
+    """
+
+    _VALUE = None  # Key under which a node stores the value of the prefix ending there
+
+    def __init__(self, mapping=None):
+        """
+        Args:
+            mapping (dict, optional): Prefix -> value pairs to insert.
+        """
+        self._root = {}
+        self._size = 0
+        if mapping:
+            for prefix, value in mapping.items():
+                self.insert(prefix, value)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, prefix):
+        node = self._find_node(prefix)
+        return node is not None and self._VALUE in node
+
+    def insert(self, prefix, value):
+        """Registers `prefix`, replacing any value it was previously mapped to."""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        if self._VALUE not in node:
+            self._size += 1
+        node[self._VALUE] = value
+
+    def longest_match(self, text, default=None):
+        """
+        Returns the value of the longest registered prefix of `text`, or `default`
+        when no registered prefix matches.
+        """
+        node = self._root
+        match = node.get(self._VALUE, default)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            if self._VALUE in node:
+                match = node[self._VALUE]
+        return match
+
+    def _find_node(self, prefix):
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
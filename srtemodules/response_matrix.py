@@ -0,0 +1,200 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from srtemodules.data_loader import RAW_ITEM_COLUMNS
+
+# Items answered as percentages (0-100); every other item is a 1-5 Likert score
+PERCENT_ITEMS = ["PTA22", "PTA23"]
+LIKERT_ITEMS = [item for item in RAW_ITEM_COLUMNS if item not in PERCENT_ITEMS]
+
+# Values standing for a missing answer in the integer score blocks; blocks holding
+# the value as a real score are kept as float64 (see _compact_block)
+LIKERT_MISSING = np.iinfo(np.uint8).max
+PERCENT_MISSING = np.iinfo(np.int16).min
+
+
+def _compact_block(values, dtype, missing):
+    """
+    Stores a float score block (NaN = missing) as `dtype` with `missing` for NaN.
+    Blocks holding fractional or out-of-range scores are kept as float64 instead,
+    so every score is still stored exactly.
+    """
+    present = ~np.isnan(values)
+    scores = values[present]
+    info = np.iinfo(dtype)
+    low = info.min + 1 if missing == info.min else info.min
+    high = info.max - 1 if missing == info.max else info.max
+    if scores.size and (
+        (scores != np.round(scores)).any() or scores.min() < low or scores.max() > high
+    ):
+        return np.ascontiguousarray(values, dtype=np.float64)
+
+    block = np.full(values.shape, missing, dtype=dtype)
+    block[present] = scores
+    return block
+
+
+def _block_column(block, j, missing):
+    """Returns column `j` of a score block as (float64 scores, present mask)."""
+    column = block[:, j]
+    if block.dtype.kind == "f":
+        present = ~np.isnan(column)
+    else:
+        present = column != missing
+    return np.where(present, column, 0).astype(np.float64), present
+
+
+def _stack_blocks(blocks, missing):
+    """Concatenates the score blocks of several batches."""
+    if any(block.dtype.kind == "f" for block in blocks):
+        # Some batch needed float64, so the whole block is float64 with NaN
+        blocks = [
+            block if block.dtype.kind == "f" else np.where(block == missing, np.nan, block)
+            for block in blocks
+        ]
+    return np.concatenate(blocks)
+
+
+def _union_keys(columns):
+    """
+    Unions the key categoricals of several batches. Their categories are made
+    object first, as batches read apart can differ in dtype (e.g. one holding a
+    numeric course title, or no lecturer names at all).
+    """
+    return union_categoricals([
+        pd.Categorical.from_codes(column.codes, categories=column.categories.astype(object))
+        for column in columns
+    ])
+
+
+class ResponseMatrix:
+    """
+    Compact in-memory form of a raw SRTE response set.
+
+    Likert items are held in one contiguous uint8 block and the percentage items in
+    an int16 block, with LIKERT_MISSING / PERCENT_MISSING marking unanswered items;
+    'Course Title' and 'Lecturer Name' are categoricals. A response takes about 30
+    bytes instead of the few hundred of an object/float64 DataFrame row.
+    """
+
+    def __init__(self, courses, lecturers, likert, percent):
+        """
+        Args:
+            courses (pd.Categorical): Course Title of each response.
+            lecturers (pd.Categorical): Lecturer Name of each response.
+            likert (np.ndarray): Scores of the LIKERT_ITEMS, shape (responses, items).
+            percent (np.ndarray): Scores of the PERCENT_ITEMS, shape (responses, items).
+        """
+        self.courses = courses
+        self.lecturers = lecturers
+        self.likert = likert
+        self.percent = percent
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Builds the matrix of a raw data frame with the RAW_DATA_HEADER columns.
+        Non-numeric answers count as missing, as in the analysis.
+        """
+        def scores(items):
+            return df[items].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+
+        return cls(
+            pd.Categorical(df["Course Title"]),
+            pd.Categorical(df["Lecturer Name"]),
+            _compact_block(scores(LIKERT_ITEMS), np.uint8, LIKERT_MISSING),
+            _compact_block(scores(PERCENT_ITEMS), np.int16, PERCENT_MISSING),
+        )
+
+    @classmethod
+    def from_batches(cls, batches):
+        """
+        Builds the matrix from raw data frames batch by batch (e.g. from
+        iter_raw_data), so the whole response set is never held as a DataFrame.
+        """
+        parts = [cls.from_frame(batch) for batch in batches]
+        if not parts:
+            return cls.from_frame(pd.DataFrame(columns=["Course Title", "Lecturer Name"] + RAW_ITEM_COLUMNS))
+        if len(parts) == 1:
+            return parts[0]
+
+        return cls(
+            _union_keys([part.courses for part in parts]),
+            _union_keys([part.lecturers for part in parts]),
+            _stack_blocks([part.likert for part in parts], LIKERT_MISSING),
+            _stack_blocks([part.percent for part in parts], PERCENT_MISSING),
+        )
+
+    def __len__(self):
+        return len(self.courses)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the per-response arrays."""
+        return (
+            self.likert.nbytes + self.percent.nbytes
+            + self.courses.codes.nbytes + self.lecturers.codes.nbytes
+        )
+
+    def content_hash(self):
+        """
+        Returns a SHA-256 hex digest of the responses, the same for every read of
+        the same file, e.g. to tell whether a batch was already processed.
+        """
+        digest = hashlib.sha256()
+        for column in (self.courses, self.lecturers):
+            digest.update("\x1f".join(map(str, column.categories)).encode("utf-8") + b"\x1e")
+            digest.update(column.codes.astype(np.int64).tobytes())
+        for block in (self.likert, self.percent):
+            digest.update(f"{block.dtype.str}{block.shape}".encode("ascii"))
+            digest.update(np.ascontiguousarray(block).tobytes())
+        return digest.hexdigest()
+
+    def item_scores(self, item):
+        """
+        Returns the scores of one item column.
+
+        Returns:
+            tuple: (np.ndarray of float64 scores, 0 where missing,
+                    np.ndarray of bool, True where the item was answered).
+        """
+        if item in PERCENT_ITEMS:
+            return _block_column(self.percent, PERCENT_ITEMS.index(item), PERCENT_MISSING)
+        return _block_column(self.likert, LIKERT_ITEMS.index(item), LIKERT_MISSING)
+
+    def lecturer_frame(self):
+        """
+        Returns a 'Lecturer Name' frame with one row per distinct lecturer, plus a
+        trailing NaN row when some responses have no lecturer, for standardizing the
+        names once instead of once per response.
+        """
+        names = list(self.lecturers.categories)
+        if (self.lecturers.codes < 0).any():
+            names.append(np.nan)
+        return pd.DataFrame({"Lecturer Name": pd.Series(names, dtype=object)})
+
+    def with_lecturers(self, names):
+        """
+        Returns a matrix sharing these scores, with the lecturer names replaced.
+
+        Args:
+            names (sequence): New name of each lecturer category, in the order of
+                              lecturer_frame(); categories renamed to the same name
+                              are merged, and NaN names count as missing.
+        """
+        codes, categories = pd.factorize(pd.Series(list(names)[:len(self.lecturers.categories)], dtype=object))
+        # Responses without a lecturer (code -1) pick the appended -1
+        remap = np.append(codes, -1)
+        lecturers = pd.Categorical.from_codes(remap[self.lecturers.codes], categories=categories)
+        return ResponseMatrix(self.courses, lecturers, self.likert, self.percent)
+
+    def to_frame(self):
+        """Expands the matrix back into a raw data frame with NaN for missing answers."""
+        columns = {"Course Title": self.courses, "Lecturer Name": self.lecturers}
+        for item in RAW_ITEM_COLUMNS:
+            scores, present = self.item_scores(item)
+            columns[item] = np.where(present, scores, np.nan)
+        return pd.DataFrame(columns)
@@ -0,0 +1,86 @@
+import hashlib
+import sqlite3
+from importlib import metadata
+
+# Local, persistent polarity cache shared by every run and Streamlit session.
+SENTIMENT_STORE_FILE = "sentiment_cache.sqlite3"
+
+# Part of every cache key, so upgrading TextBlob (or changing how comments are
+# scored) never reuses polarities computed by an older model.
+try:
+    SENTIMENT_MODEL_VERSION = f"textblob-{metadata.version('textblob')}-pattern"
+except metadata.PackageNotFoundError: # e.g. a frozen build without package metadata
+    SENTIMENT_MODEL_VERSION = "textblob-pattern"
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS comment_polarity (
+    comment_hash TEXT PRIMARY KEY,
+    polarity REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def comment_hash(normalized_comment):
+    """Returns the cache key of a normalized comment under the current model version."""
+    return hashlib.sha1(f"{SENTIMENT_MODEL_VERSION}\0{normalized_comment}".encode("utf-8")).hexdigest()
+
+
+def _connect(file_path):
+    connection = sqlite3.connect(file_path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def lookup_polarities(normalized_comments, file_path=SENTIMENT_STORE_FILE):
+    """
+    Looks up stored polarities in bulk.
+
+    Args:
+        normalized_comments (iterable): Normalized comment texts.
+        file_path (str): Path of the SQLite sentiment store (created if missing).
+
+    Returns:
+        dict: Normalized comment -> polarity, for the comments already in the store.
+    """
+    by_hash = {comment_hash(comment): comment for comment in normalized_comments}
+    hashes = list(by_hash)
+    found = {}
+    connection = _connect(file_path)
+    try:
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            batch = hashes[start:start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = connection.execute(
+                f"SELECT comment_hash, polarity FROM comment_polarity WHERE comment_hash IN ({placeholders})",
+                batch,
+            )
+            for key, polarity in rows:
+                found[by_hash[key]] = polarity
+    finally:
+        connection.close()
+    return found
+
+
+def store_polarities(polarities, file_path=SENTIMENT_STORE_FILE):
+    """
+    Saves newly computed polarities.
+
+    Args:
+        polarities (dict): Normalized comment -> polarity.
+        file_path (str): Path of the SQLite sentiment store (created if missing).
+    """
+    if not polarities:
+        return
+    connection = _connect(file_path)
+    try:
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO comment_polarity (comment_hash, polarity) VALUES (?, ?)",
+                [(comment_hash(comment), polarity) for comment, polarity in polarities.items()],
+            )
+    finally:
+        connection.close()
@@ -1,12 +1,12 @@
 import numpy as np
 import pandas as pd
-from fpdf2 import FPDF # Changed from fpdf to fpdf2
+from fpdf import FPDF # fpdf2 installs under the fpdf module name
 import os
 # Removed requests import as automatic download is removed
 from datetime import datetime
 import re
 
-from srtemodules.comments_extractor import extract_dislikes, extract_likes, analyze_sentiment
+from srtemodules.comments_extractor import NO_COMMENTS, analyze_sentiment, build_comment_index
 
 # --- Font Setup for Unicode Support ---
 FONT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,29 +17,96 @@ DEJAVU_JSON_PATH = os.path.join(FONT_DIR, 'DejaVuSans.json')
 # Font files (DejaVuSans.ttf and DejaVuSans.json) are now expected to be
 # manually placed in the srtemodules directory.
 
-# Removed output_dir parameter as Streamlit app doesn't pass it
-def get_report(student_list, df, semester, year):
-    """
-    Generates a PDF report for each student/lecturer entry in the student_list.
-    Includes overall scores, percentages, and extracted comments with sentiment.
-    """
-    # Ensure fonts are available before starting PDF generation
+def check_fonts():
+    """Raises FileNotFoundError if the DejaVu font files are missing."""
     if not os.path.exists(DEJAVU_TTF_PATH):
         raise FileNotFoundError(f"DejaVuSans.ttf not found at {DEJAVU_TTF_PATH}. Please manually place it in the srtemodules folder.")
     if not os.path.exists(DEJAVU_JSON_PATH):
         raise FileNotFoundError(f"DejaVuSans.json not found at {DEJAVU_JSON_PATH}. Please manually place it in the srtemodules folder.")
 
+# Faces registered on every report document. There is no separate bold file,
+# so bold is registered from the same TTF.
+REPORT_FONT_FACES = (('DejaVuSans', ''), ('DejaVuSans', 'B'))
 
+_fonts_ready = False
+
+def new_report_document():
+    """Returns an empty A4 report document with the DejaVu faces registered once."""
     pdf = FPDF("P", "mm", "A4")
+    for family, style in REPORT_FONT_FACES:
+        pdf.add_font(family, style, DEJAVU_TTF_PATH, uni=True)
+    return pdf
+
+def prepare_report_fonts():
+    """
+    Checks the fonts and registers them on a throwaway document, once per process,
+    so the TTF is parsed (and pyfpdf's font metric cache written) before the first
+    real report rather than by several report workers at once.
+    """
+    global _fonts_ready
+    if not _fonts_ready:
+        check_fonts()
+        new_report_document()
+        _fonts_ready = True
+
+def document_bytes(pdf):
+    """Returns a finished document as bytes (pyfpdf renders to str, fpdf2 to bytearray)."""
+    data = pdf.output(dest="S")
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+    return bytes(data)
+
+def report_filename(row):
+    """Returns the PDF file name of the report whose last page is `row`."""
+    # Sanitize the filename for invalid characters
+    sanitized_lecturer_name = re.sub(r'[\\/:*?"<>|]', '_', str(row['Lecturer Name']).replace(',', '').replace('.', '').strip())
+    sanitized_course_title = re.sub(r'[\\/:*?"<>|]', '_', str(row['Course Title']).strip())
+    return f"{sanitized_lecturer_name}_{sanitized_course_title}.pdf"
+
+# Removed output_dir parameter as Streamlit app doesn't pass it
+def get_report(student_list, df, semester, year, comment_index=None):
+    """
+    Generates a PDF report for the student/lecturer entries in the student_list and
+    writes it to the current working directory.
+
+    Returns the name of the PDF file written.
+    """
+    output_filename, data = render_report(student_list, df, semester, year, comment_index)
+    with open(output_filename, "wb") as pdf_file:
+        pdf_file.write(data)
+    return output_filename
+
+def render_report(student_list, df, semester, year, comment_index=None):
+    """
+    Renders the PDF report of the student/lecturer entries in the student_list, one
+    page per entry. Includes overall scores, percentages, and extracted comments
+    with sentiment.
+
+    Args:
+        student_list (pd.DataFrame): Summary rows of one lecturer.
+        df (pd.DataFrame): Comment data; only used when comment_index is not given.
+        semester (str): Semester printed in the page header.
+        year (str): Academic session printed in the page header.
+        comment_index (dict): The build_comment_index() result for the batch's
+                              comment frame; when it is not given, one is built
+                              from `df` for this student_list only.
+
+    Returns:
+        tuple: (file name, PDF bytes) of the report. Nothing is written to disk.
+    """
+    # Ensure fonts are available before starting PDF generation
+    prepare_report_fonts()
+
+    if comment_index is None:
+        lecturers = student_list['Lecturer Name'].astype(str).unique()
+        comment_index = build_comment_index(df[df['Lecturer Name'].isin(lecturers)])
+
+    pdf = new_report_document()
 
     for _, row in student_list.iterrows():
         pdf.add_page()
         pdf.ln()
 
-        # fpdf2's add_font is slightly different, but this should still work
-        pdf.add_font('DejaVuSans', '', DEJAVU_TTF_PATH, uni=True)
-        pdf.add_font('DejaVuSans', 'B', DEJAVU_TTF_PATH, uni=True)
-
         # Page header section
         pdf.set_font("DejaVuSans", "B", 12)
         pdf.set_y(7)
@@ -111,9 +178,8 @@ def get_report(student_list, df, semester, year):
         pdf.cell(75, height, f"{row['ES %']}%" if pd.notna(row['ES %']) else '', 0, 1, 'C')
         pdf.ln()
 
-        # Filter comments for the current lecturer and course
-        filter_lecturer = df[df['Lecturer Name'] == str(row['Lecturer Name'])]
-        filter_course = filter_lecturer[filter_lecturer['Course Title'] == str(row['Course Title'])]
+        # Pre-aggregated comments for the current lecturer and course
+        comments = comment_index.get((str(row['Lecturer Name']), str(row['Course Title'])), NO_COMMENTS)
         
         # --- LIKES SECTION ---
         pdf.set_font('DejaVuSans', 'B', 12)
@@ -122,7 +188,7 @@ def get_report(student_list, df, semester, year):
         pdf.set_x(15)
         pdf.cell(0, height, '1. Indicate three things you experienced in this course that you liked', 0, 1, "L")
         
-        likes_formatted, likes_polarities = extract_likes(df, filter_course)
+        likes_formatted, likes_polarities = comments['likes']
         
         pdf.set_font('DejaVuSans', '', 12)
         w_comment = 170
@@ -151,7 +217,7 @@ def get_report(student_list, df, semester, year):
         pdf.set_x(15)
         pdf.cell(0, height, '2. List three things you experienced that you did not like', 0, 1, "L")
         
-        dislikes_formatted, dislikes_polarities = extract_dislikes(df, filter_course)
+        dislikes_formatted, dislikes_polarities = comments['dislikes']
         
         pdf.set_font('DejaVuSans', '', 12)
         
@@ -210,11 +276,5 @@ def get_report(student_list, df, semester, year):
         pdf.set_y(-25)
         pdf.set_font('DejaVuSans', '', 10)
         pdf.cell(0, 2, f'Page {pdf.page_no()}', 0, 0, 'C')
-    
-    # Sanitize the filename for invalid characters
-    sanitized_lecturer_name = re.sub(r'[\\/:*?"<>|]', '_', str(row['Lecturer Name']).replace(',', '').replace('.', '').strip())
-    sanitized_course_title = re.sub(r'[\\/:*?"<>|]', '_', str(row['Course Title']).strip())
 
-    # output_dir is not passed by Streamlit app, so save to current working directory
-    output_filename = f"{sanitized_lecturer_name}_{sanitized_course_title}.pdf"
-    pdf.output(output_filename, "F")
+    return report_filename(row), document_bytes(pdf)
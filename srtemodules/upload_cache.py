@@ -0,0 +1,151 @@
+import hashlib
+import io
+import os
+import pickle
+import threading
+import time
+
+import pandas as pd
+
+# Local cache of parsed uploads, shared by every Streamlit session and app restart.
+# Entries are keyed by the SHA-256 of the uploaded bytes, so re-opening the same
+# workbook skips the Excel parse entirely.
+UPLOAD_CACHE_DIR = "upload_cache"
+
+# Total size the cache is trimmed back to, least recently used entries first
+UPLOAD_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Part of every cache key; bump it when a reader's output changes
+UPLOAD_CACHE_FORMAT_VERSION = 2
+
+PARQUET_SUFFIX = ".parquet"
+PICKLE_SUFFIX = ".pkl"
+TEMP_SUFFIX = ".tmp"
+
+# Temporary files older than this were left by a failed or killed write, not one in progress
+STALE_TEMP_SECONDS = 3600
+
+
+def upload_bytes(datafile):
+    """Returns the raw bytes of an upload (a Streamlit UploadedFile, file object or path)."""
+    if hasattr(datafile, "getvalue"):
+        return datafile.getvalue()
+    if hasattr(datafile, "read"):
+        position = datafile.tell()
+        data = datafile.read()
+        datafile.seek(position)
+        return data
+    with open(datafile, "rb") as file:
+        return file.read()
+
+
+def upload_key(data, kind):
+    """Returns the cache key of upload bytes parsed by the `kind` reader."""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{kind}-v{UPLOAD_CACHE_FORMAT_VERSION}-{digest}"
+
+
+def _read_entry(path):
+    if path.endswith(PARQUET_SUFFIX):
+        return pd.read_parquet(path)
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def _write_entry(cache_dir, key, df):
+    """
+    Saves a parsed frame as Parquet, or pickles it when Parquet is unavailable
+    (no pyarrow/fastparquet) or cannot hold it (e.g. a column mixing text and numbers).
+    """
+    # Unique per writer, as Streamlit sessions share the process
+    temp_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}")
+    try:
+        try:
+            df.to_parquet(temp_path)
+            suffix = PARQUET_SUFFIX
+        except (ImportError, ValueError, TypeError, NotImplementedError):
+            with open(temp_path, "wb") as file:
+                pickle.dump(df, file, protocol=pickle.HIGHEST_PROTOCOL)
+            suffix = PICKLE_SUFFIX
+        # Atomic, so a concurrent session never reads a half-written entry
+        os.replace(temp_path, os.path.join(cache_dir, key + suffix))
+    finally:
+        # Only left behind if the write failed
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass # removed by _evict once stale
+
+
+def _evict(cache_dir, max_bytes):
+    """
+    Deletes temporary files left by failed writes, then least recently used entries
+    until the cache, including writes in progress, fits in `max_bytes`.
+    """
+    entries = []
+    total = 0
+    stale_before = time.time() - STALE_TEMP_SECONDS
+    for entry in os.scandir(cache_dir):
+        if not entry.is_file():
+            continue
+        stat = entry.stat()
+        if entry.name.endswith(TEMP_SUFFIX):
+            if stat.st_mtime < stale_before:
+                try:
+                    os.remove(entry.path)
+                    continue
+                except OSError:
+                    pass
+            total += stat.st_size # still being written, or could not be removed
+        elif entry.name.endswith((PARQUET_SUFFIX, PICKLE_SUFFIX)):
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total += sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError: # already evicted by another session, or still open on Windows
+            continue
+        total -= size
+
+
+def cached_read(datafile, reader, kind, cache_dir=UPLOAD_CACHE_DIR, max_bytes=UPLOAD_CACHE_MAX_BYTES):
+    """
+    Parses an upload with `reader`, or returns the frame parsed from the same bytes before.
+
+    Args:
+        datafile: The upload, as accepted by upload_bytes.
+        reader (callable): Parses a file object into a DataFrame, e.g. read_raw_data.
+        kind (str): Names the reader in the cache key, so one workbook read by two
+                    readers is cached twice.
+        cache_dir (str): Cache folder (created if missing).
+        max_bytes (int): Size the cache is trimmed back to after a new entry.
+
+    Returns:
+        pd.DataFrame: The parsed upload. Errors raised by `reader` are not cached.
+    """
+    data = upload_bytes(datafile)
+    key = upload_key(data, kind)
+
+    for suffix in (PARQUET_SUFFIX, PICKLE_SUFFIX):
+        path = os.path.join(cache_dir, key + suffix)
+        if os.path.exists(path):
+            try:
+                df = _read_entry(path)
+                os.utime(path) # mark as recently used
+                return df
+            except Exception as e:
+                print(f"Warning: Could not read cached upload {path}, parsing it again: {e}")
+
+    df = reader(io.BytesIO(data))
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_entry(cache_dir, key, df)
+        _evict(cache_dir, max_bytes)
+    except OSError as e:
+        print(f"Warning: Could not cache parsed upload: {e}")
+    return df